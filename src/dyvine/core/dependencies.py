@@ -16,9 +16,10 @@
   wired into the runtime container).
 
 `initialize` is awaited from the FastAPI lifespan; `shutdown` drains
-the `BackgroundTaskRegistry` and reaps every executor in reverse
-initialisation order so a graceful shutdown never tears the
-executor pools down before in-flight uploads / SQLite commits finish.
+the `BackgroundTaskRegistry`, closes the shared handler's pooled HTTP
+client, and reaps every executor in reverse initialisation order so a
+graceful shutdown never tears the executor pools down before in-flight
+uploads / SQLite commits finish.
 
 `require_api_key` (also exported here) is the FastAPI dependency
 mounted at every router; it uses `hmac.compare_digest` and short-
@@ -36,9 +37,10 @@ Example:
 """
 
 import hmac
+import threading
 from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from typing import Annotated, Any
+from typing import Annotated, Any, NoReturn
 
 from f2.apps.douyin.handler import DouyinHandler  # type: ignore
 from fastapi import Header, HTTPException, status
@@ -47,9 +49,23 @@ from ..services.livestreams import LivestreamService
 from ..services.posts import PostService
 from ..services.users import UserService
 from .background import BackgroundTaskRegistry
+from .douyin import close_handler_downloader
 from .operations import OperationStore
 from .settings import settings
 
+# Names ``ServiceContainer.get_service`` resolves; each is backed by a
+# ``_<name>`` attribute. Anything else (executors, flags) is internal and
+# must not be reachable through the by-name lookup.
+_SERVICE_NAMES: frozenset[str] = frozenset(
+    {
+        "douyin_handler",
+        "operation_store",
+        "user_service",
+        "livestream_service",
+        "post_service",
+    }
+)
+
 # Dedicated thread pool sizes per IO domain. The defaults are tuned for the
 # single-worker uvicorn deployment: R2 uploads are the dominant long-running
 # call, sqlite writes are short but frequent, and audit log writes are rare
@@ -67,6 +83,26 @@ R2_HEAD_EXECUTOR_MAX_WORKERS = 16
 SQLITE_EXECUTOR_MAX_WORKERS = 4
 AUDIT_EXECUTOR_MAX_WORKERS = 2
 
+# Settings-independent ``DouyinHandler`` kwargs. ``_create_douyin_config``
+# copies this into a fresh dict per call (f2 keeps and may update the
+# mapping it is given), then layers the settings-derived keys on top.
+_DOUYIN_STATIC_CONFIG: dict[str, Any] = {
+    "mode": "all",
+    "interval": "all",
+    "max_retries": 5,
+    "timeout": 30,
+    "chunk_size": 1024 * 1024,
+    "max_tasks": 3,
+    "folderize": True,
+    "download_image": True,
+    "download_video": True,
+    "download_live": True,
+    "download_collection": True,
+    "download_story": True,
+    "naming": "{create}_{desc}",
+    "page_counts": 100,
+}
+
 
 class ServiceContainer:
     """Service container for dependency injection and lifecycle management.
@@ -75,8 +111,12 @@ class ServiceContainer:
     management of application services and their dependencies. Services are
     lazily initialized and cached for reuse throughout the application lifecycle.
 
+    Each service lives in its own attribute (``_douyin_handler``,
+    ``_post_service``...) rather than a name-keyed dict, so the properties
+    that dependency providers hit on every request are a single attribute
+    load plus a ``None`` check.
+
     Attributes:
-        _services: Internal dictionary storing initialized service instances.
         _initialized: Flag indicating whether the container has been initialized.
 
     Example:
@@ -87,11 +127,6 @@ class ServiceContainer:
             # Access services via properties
             douyin_handler = container.douyin_handler
             user_service = container.user_service
-
-        Custom service registration:
-            container = ServiceContainer()
-            custom_service = MyCustomService()
-            container._services['custom'] = custom_service
     """
 
     def __init__(self) -> None:
@@ -100,8 +135,12 @@ class ServiceContainer:
         Services are not initialized until initialize() is called explicitly
         or accessed via property methods.
         """
-        self._services: dict[str, Any] = {}
         self._initialized = False
+        self._douyin_handler: DouyinHandler | None = None
+        self._operation_store: OperationStore | None = None
+        self._user_service: UserService | None = None
+        self._livestream_service: LivestreamService | None = None
+        self._post_service: PostService | None = None
         self._r2_executor: ThreadPoolExecutor | None = None
         self._r2_head_executor: ThreadPoolExecutor | None = None
         self._sqlite_executor: ThreadPoolExecutor | None = None
@@ -167,7 +206,8 @@ class ServiceContainer:
 
         # Initialize Douyin handler with configuration
         douyin_config = self._create_douyin_config()
-        self._services["douyin_handler"] = DouyinHandler(douyin_config)
+        douyin_handler = DouyinHandler(douyin_config)
+        self._douyin_handler = douyin_handler
 
         # Initialize operation store (sqlite bootstrap happens synchronously
         # inside the constructor, which is cheap and keeps the OperationStore
@@ -175,7 +215,7 @@ class ServiceContainer:
         # executor is attached immediately so the recovery sweep below
         # already runs on the bounded pool.
         operation_store = OperationStore(executor=self._sqlite_executor)
-        self._services["operation_store"] = operation_store
+        self._operation_store = operation_store
         await operation_store.mark_incomplete_operations_failed()
 
         # Initialize user service and wire its R2 client to the R2 executor.
@@ -189,11 +229,11 @@ class ServiceContainer:
         )
         user_service.storage.set_executor(self._r2_executor)
         user_service.storage.set_head_executor(self._r2_head_executor)
-        self._services["user_service"] = user_service
+        self._user_service = user_service
 
         # Initialize livestream service
-        self._services["livestream_service"] = LivestreamService(
-            douyin_handler=self._services["douyin_handler"],
+        self._livestream_service = LivestreamService(
+            douyin_handler=douyin_handler,
             user_service=user_service,
             operation_store=operation_store,
             task_registry=self._background_tasks,
@@ -202,8 +242,8 @@ class ServiceContainer:
         # Initialize post service. Bulk downloads are scheduled as
         # long-running background tasks, so wire the service to the same
         # operation store and registry the lifespan drains on shutdown.
-        self._services["post_service"] = PostService(
-            handler=self._services["douyin_handler"],
+        self._post_service = PostService(
+            handler=douyin_handler,
             operation_store=operation_store,
             task_registry=self._background_tasks,
         )
@@ -232,11 +272,22 @@ class ServiceContainer:
         # on a stuck upstream request.
         await self._background_tasks.drain()
 
+        # Every bulk post download goes through the one shared handler, so
+        # its downloader's httpx client is the connection pool those jobs
+        # reuse. Close it once nothing can still be downloading instead of
+        # leaving the keep-alive sockets to garbage collection.
+        await close_handler_downloader(self._douyin_handler)
+
+        if self._user_service is not None:
+            await self._user_service.close()
+
+        if self._post_service is not None:
+            await self._post_service.close()
+
         # Let the operation store close its per-thread reader connections
         # before we reap the sqlite executor that owns those worker threads.
-        operation_store = self._services.get("operation_store")
-        if isinstance(operation_store, OperationStore):
-            operation_store.shutdown()
+        if self._operation_store is not None:
+            self._operation_store.shutdown()
 
         # Reverse of init order. The R2 head pool is drained first so any
         # ``list_objects`` follow-up still has a working main pool to
@@ -255,7 +306,11 @@ class ServiceContainer:
                 executor.shutdown(wait=True)
                 setattr(self, attr, None)
 
-        self._services.clear()
+        self._douyin_handler = None
+        self._operation_store = None
+        self._user_service = None
+        self._livestream_service = None
+        self._post_service = None
         self._initialized = False
 
     def _create_douyin_config(self) -> dict[str, Any]:
@@ -269,25 +324,13 @@ class ServiceContainer:
             Dictionary containing all DouyinHandler configuration parameters
             including headers, proxies, download settings, and file naming rules.
         """
+        douyin = settings.douyin
         return {
-            "headers": settings.douyin.headers,
-            "proxies": settings.douyin.proxies,
-            "mode": "all",
-            "interval": "all",
-            "cookie": settings.douyin.cookie,
-            "path": settings.douyin.download_root,
-            "max_retries": 5,
-            "timeout": 30,
-            "chunk_size": 1024 * 1024,
-            "max_tasks": 3,
-            "folderize": True,
-            "download_image": True,
-            "download_video": True,
-            "download_live": True,
-            "download_collection": True,
-            "download_story": True,
-            "naming": "{create}_{desc}",
-            "page_counts": 100,
+            **_DOUYIN_STATIC_CONFIG,
+            "headers": douyin.headers,
+            "proxies": douyin.proxies,
+            "cookie": douyin.cookie,
+            "path": douyin.download_root,
         }
 
     def get_service(self, service_name: str) -> Any:
@@ -310,12 +353,19 @@ class ServiceContainer:
             RuntimeError: If ``initialize`` has not been awaited yet.
         """
         if not self._initialized:
-            raise RuntimeError(
-                "ServiceContainer has not been initialized; await "
-                "container.initialize() (normally via the FastAPI lifespan) "
-                "before requesting services."
-            )
-        return self._services.get(service_name)
+            self._raise_not_initialized()
+        if service_name not in _SERVICE_NAMES:
+            return None
+        return getattr(self, f"_{service_name}")
+
+    @staticmethod
+    def _raise_not_initialized() -> NoReturn:
+        """Raise the error shared by every accessor on a cold container."""
+        raise RuntimeError(
+            "ServiceContainer has not been initialized; await "
+            "container.initialize() (normally via the FastAPI lifespan) "
+            "before requesting services."
+        )
 
     @property
     def douyin_handler(self) -> DouyinHandler:
@@ -324,7 +374,10 @@ class ServiceContainer:
         Returns:
             DouyinHandler instance configured with application settings.
         """
-        return self.get_service("douyin_handler")
+        service = self._douyin_handler
+        if service is None:
+            self._raise_not_initialized()
+        return service
 
     @property
     def user_service(self) -> UserService:
@@ -333,43 +386,51 @@ class ServiceContainer:
         Returns:
             UserService instance for user-related operations.
         """
-        service = self.get_service("user_service")
-        if not isinstance(service, UserService):
-            raise TypeError("user_service is not a UserService instance")
+        service = self._user_service
+        if service is None:
+            self._raise_not_initialized()
         return service
 
     @property
     def operation_store(self) -> OperationStore:
         """Get the persistent operation store."""
-        service = self.get_service("operation_store")
-        if not isinstance(service, OperationStore):
-            raise TypeError("operation_store is not an OperationStore instance")
+        service = self._operation_store
+        if service is None:
+            self._raise_not_initialized()
         return service
 
     @property
     def livestream_service(self) -> LivestreamService:
         """Get the livestream management service."""
-        service = self.get_service("livestream_service")
-        if not isinstance(service, LivestreamService):
-            raise TypeError("livestream_service is not a LivestreamService instance")
+        service = self._livestream_service
+        if service is None:
+            self._raise_not_initialized()
         return service
 
     @property
     def post_service(self) -> PostService:
         """Get the post management service."""
-        service = self.get_service("post_service")
-        if not isinstance(service, PostService):
-            raise TypeError("post_service is not a PostService instance")
+        service = self._post_service
+        if service is None:
+            self._raise_not_initialized()
         return service
 
 
-@lru_cache
+# Process-wide container. ``get_service_container`` reads the global on the
+# fast path and only takes the lock for the first construction, so two
+# threads racing on a cold start cannot build two containers.
+_container: ServiceContainer | None = None
+_container_lock = threading.Lock()
+
+
 def get_service_container() -> ServiceContainer:
-    """Get cached service container instance.
+    """Get the process-wide service container instance.
 
     Returns a singleton ServiceContainer instance, creating it on first
-    access and caching it for subsequent calls. This ensures consistent
-    service instances throughout the application lifecycle.
+    access and reusing it for subsequent calls. This ensures consistent
+    service instances throughout the application lifecycle. The container
+    is only constructed here; ``initialize`` is a coroutine and is awaited
+    by the FastAPI lifespan.
 
     Returns:
         ServiceContainer singleton instance.
@@ -380,11 +441,32 @@ def get_service_container() -> ServiceContainer:
         container2 = get_service_container()
         assert container1 is container2
     """
-    return ServiceContainer()
+    global _container
+    container = _container
+    if container is None:
+        with _container_lock:
+            container = _container
+            if container is None:
+                container = _container = ServiceContainer()
+    return container
+
+
+def reset_service_container() -> None:
+    """Drop the process-wide container so the next call builds a fresh one.
+
+    Intended for tests; the running application keeps one container for
+    its whole lifetime.
+    """
+    global _container
+    with _container_lock:
+        _container = None
 
 
-# FastAPI dependency provider functions
-def get_douyin_handler() -> DouyinHandler:
+# FastAPI dependency provider functions. They are ``async def`` because they
+# never block: FastAPI would otherwise run each one through the threadpool,
+# adding a thread hand-off per provider to every routed request. The
+# container itself is built and initialized once by the lifespan.
+async def get_douyin_handler() -> DouyinHandler:
     """FastAPI dependency provider for Douyin handler service.
 
     This function provides a DouyinHandler instance for FastAPI dependency
@@ -406,7 +488,7 @@ def get_douyin_handler() -> DouyinHandler:
     return get_service_container().douyin_handler
 
 
-def get_user_service() -> UserService:
+async def get_user_service() -> UserService:
     """FastAPI dependency provider for user service.
 
     This function provides a UserService instance for FastAPI dependency
@@ -428,12 +510,12 @@ def get_user_service() -> UserService:
     return get_service_container().user_service
 
 
-def get_livestream_service() -> LivestreamService:
+async def get_livestream_service() -> LivestreamService:
     """FastAPI dependency provider for livestream service."""
     return get_service_container().livestream_service
 
 
-def get_post_service() -> PostService:
+async def get_post_service() -> PostService:
     """FastAPI dependency provider for post service.
 
     Returns the container-managed ``PostService`` so bulk downloads share
@@ -444,11 +526,26 @@ def get_post_service() -> PostService:
     return get_service_container().post_service
 
 
-def require_api_key(
+@lru_cache(maxsize=1)
+def _expected_api_key_bytes(api_key: str) -> bytes:
+    """Return the UTF-8 encoding of the configured API key.
+
+    Keyed on the configured value (never on the client-supplied header), so
+    the cache holds exactly one entry and a rotated or monkeypatched key is
+    picked up on the next request without an explicit ``cache_clear``.
+    """
+    return api_key.encode("utf-8")
+
+
+async def require_api_key(
     x_api_key: Annotated[str | None, Header(alias="X-API-Key")] = None,
 ) -> None:
     """Reject requests that do not present a matching ``X-API-Key`` header.
 
+    Declared ``async`` even though it never awaits: FastAPI runs plain
+    ``def`` dependencies through the threadpool, which would add a thread
+    hand-off to every routed request for a check that takes microseconds.
+
     Uses ``settings.security.api_key`` as the expected value. The check is
     bypassed entirely when ``settings.security.require_api_key`` is
     ``False`` so deployments fronted by mTLS or a mesh policy can opt out.
@@ -463,8 +560,13 @@ def require_api_key(
     # matching prefix, which prevents a remote attacker from probing the
     # secret a byte at a time via response-latency timing. The empty
     # fallbacks keep the comparison length-balanced when either side is
-    # missing so the rejection path also has uniform timing.
-    if not expected or not hmac.compare_digest(x_api_key or "", expected):
+    # missing so the rejection path also has uniform timing. Comparing
+    # bytes rather than ``str`` keeps non-ASCII headers on the 401 path:
+    # ``compare_digest`` raises ``TypeError`` for non-ASCII ``str`` input.
+    presented = (x_api_key or "").encode("utf-8", "surrogateescape")
+    if not expected or not hmac.compare_digest(
+        presented, _expected_api_key_bytes(expected)
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or missing API key",
@@ -0,0 +1,35 @@
+"""Shared lifecycle helpers for f2 ``DouyinHandler`` instances.
+
+Both ``core/dependencies.py::ServiceContainer.shutdown`` (the shared bulk
+download handler) and ``services/users.py::UserService.close`` (the
+profile lookup handler) release the same f2 resource: the httpx client
+owned by ``handler.downloader``. Closing it in one place keeps failure
+handling identical for every handler the application creates.
+"""
+
+from __future__ import annotations
+
+import inspect
+from typing import Any
+
+from .logging import ContextLogger
+
+logger = ContextLogger(__name__)
+
+
+async def close_handler_downloader(handler: Any) -> None:
+    """Best-effort close of ``handler.downloader`` and its HTTP client.
+
+    f2 does not document the close surface, so a missing or sync ``close``
+    is tolerated. Errors are logged rather than raised; shutdown must keep
+    going.
+    """
+    close = getattr(getattr(handler, "downloader", None), "close", None)
+    if not callable(close):
+        return
+    try:
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+    except Exception:
+        logger.warning("Failed to close Douyin downloader", exc_info=True)
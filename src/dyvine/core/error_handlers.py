@@ -43,6 +43,26 @@ _DYVINE_STATUS_MAPPING: tuple[tuple[type[DyvineError], int], ...] = (
     (ServiceError, status.HTTP_500_INTERNAL_SERVER_ERROR),
 )
 
+# Resolved status code per concrete exception type, filled on first sight.
+# Error responses then cost one ``dict.get`` on ``type(exc)`` instead of an
+# ``isinstance`` walk over the mapping; the exception hierarchy is fixed at
+# import time, so entries never go stale.
+_status_code_by_type: dict[type[DyvineError], int] = {}
+
+
+def _status_code_for(exc: DyvineError) -> int:
+    """Return the HTTP status code ``_DYVINE_STATUS_MAPPING`` assigns ``exc``."""
+    exc_cls = type(exc)
+    status_code = _status_code_by_type.get(exc_cls)
+    if status_code is None:
+        status_code = status.HTTP_400_BAD_REQUEST
+        for exc_type, mapped_code in _DYVINE_STATUS_MAPPING:
+            if issubclass(exc_cls, exc_type):
+                status_code = mapped_code
+                break
+        _status_code_by_type[exc_cls] = status_code
+    return status_code
+
 
 class ErrorResponse:
     """Standardized error response structure."""
@@ -109,11 +129,7 @@ async def dyvine_error_handler(request: Request, exc: DyvineError) -> JSONRespon
     """
     correlation_id = getattr(request.state, "correlation_id", None)
 
-    status_code = status.HTTP_400_BAD_REQUEST
-    for exc_type, mapped_code in _DYVINE_STATUS_MAPPING:
-        if isinstance(exc, exc_type):
-            status_code = mapped_code
-            break
+    status_code = _status_code_for(exc)
 
     extra = {
         "error_code": exc.error_code,
@@ -6,30 +6,37 @@ Exposes a `ContextLogger` wrapper that:
   `contextvars.ContextVar` slots so they propagate naturally across
   asyncio tasks, including background work spawned via
   `BackgroundTaskRegistry`.
-- Emits log records as JSON via `JSONFormatter` (file + stdout) and a
-  human-readable formatter for console output when `API_DEBUG=true`.
+- Emits log records as JSON via `JSONFormatter` (file + stdout, encoded
+  with pydantic-core's Rust serializer) and a human-readable formatter
+  for console output when `API_DEBUG=true`.
 - Provides `track_time` / `track_memory` async context managers that
   log a single completion record with elapsed milliseconds or RSS
   delta, suitable for wrapping route handlers.
 
 `setup_logging` configures the root logger with a `TimedRotatingFileHandler`
 keyed on UTC midnight so the active filename `dyvine.log` rotates
-cleanly across day boundaries.
+cleanly across day boundaries. The file and console handlers sit behind a
+`QueueListener` thread so emitting a record from a coroutine never blocks
+the event loop on a `write()`; `shutdown_logging` stops the listener and
+flushes whatever is still queued.
 """
 
+import atexit
 import contextvars
-import json
 import logging
 import logging.handlers
+import math
+import os
+import queue
 import sys
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from datetime import UTC, datetime
 from pathlib import Path
-from time import perf_counter
+from time import gmtime, perf_counter, strftime
 from typing import Any
 
 import psutil
+from pydantic_core import to_json
 
 from .settings import settings
 
@@ -59,6 +66,34 @@ def set_correlation_id(correlation_id: str | None) -> None:
     _correlation_id_var.set(correlation_id)
 
 
+# Marks an optional ``LogRecord`` attribute as absent in ``JSONFormatter``.
+_MISSING: Any = object()
+
+# Background listener that owns the real file/console handlers. Kept at
+# module level so ``shutdown_logging`` can stop it from the lifespan hook and
+# a repeated ``setup_logging`` call can tell logging is already configured.
+_queue_listener: logging.handlers.QueueListener | None = None
+# Root-logger handler feeding ``_queue_listener``. Removed again by
+# ``shutdown_logging`` so records logged afterwards are not parked in a
+# queue nobody drains.
+_queue_handler: logging.handlers.QueueHandler | None = None
+
+
+# ``psutil.Process`` handle reused by ``track_memory``. Keyed on the pid so a
+# handle created before a fork is not used to sample the parent from the
+# child worker.
+_process: psutil.Process | None = None
+
+
+def _current_process() -> psutil.Process:
+    """Return a cached ``psutil.Process`` for the running process."""
+    global _process
+    process = _process
+    if process is None or process.pid != os.getpid():
+        process = _process = psutil.Process()
+    return process
+
+
 def clear_logging_context() -> None:
     """Reset the request-scoped logging context dict."""
     _context_var.set({})
@@ -67,6 +102,32 @@ def clear_logging_context() -> None:
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
 
+    # Whole-second UTC prefix of the last rendered timestamp. Bursts of
+    # records inside the same second only append the microseconds instead of
+    # building a ``datetime`` and calling ``isoformat`` per record.
+    _ts_second: int = -1
+    _ts_prefix: str = ""
+
+    def _format_timestamp(self, created: float) -> str:
+        """Render ``created`` exactly like ``datetime.isoformat`` in UTC.
+
+        Microseconds are rounded half-to-even (carrying into the next second)
+        as ``datetime.fromtimestamp`` does, and a whole second drops the
+        fractional part, e.g. ``2025-10-09T08:53:20+00:00``.
+        """
+        fraction, whole = math.modf(created)
+        second = int(whole)
+        micros = round(fraction * 1_000_000)
+        if micros >= 1_000_000:
+            second += 1
+            micros -= 1_000_000
+        if second != self._ts_second:
+            self._ts_prefix = strftime("%Y-%m-%dT%H:%M:%S", gmtime(second))
+            self._ts_second = second
+        if micros:
+            return f"{self._ts_prefix}.{micros:06d}+00:00"
+        return f"{self._ts_prefix}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:
         """Serialize a log record into the JSON logging contract.
 
@@ -77,7 +138,7 @@ class JSONFormatter(logging.Formatter):
             JSON string containing the normalized log fields.
         """
         log_data = {
-            "timestamp": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -87,17 +148,49 @@ class JSONFormatter(logging.Formatter):
         }
 
         if record.exc_info and record.exc_info[0] is not None:
+            # The file and console handlers format the same record one after
+            # the other; cache the rendered traceback on ``exc_text`` the way
+            # ``logging.Formatter.format`` does so it is walked only once.
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
             log_data["exception"] = {
                 "type": record.exc_info[0].__name__,
                 "message": str(record.exc_info[1]),
-                "traceback": self.formatException(record.exc_info),
+                "traceback": record.exc_text,
             }
 
-        for attr in ["correlation_id", "extra"]:
-            if hasattr(record, attr):
-                log_data[attr] = getattr(record, attr)
+        # ``extra`` keys land in the record's instance dict, so read them
+        # there directly: a plain dict probe, no attribute protocol. The
+        # sentinel keeps an explicit ``None`` in the output.
+        fields = record.__dict__
+        correlation_id = fields.get("correlation_id", _MISSING)
+        if correlation_id is not _MISSING:
+            log_data["correlation_id"] = correlation_id
+        extra = fields.get("extra", _MISSING)
+        if extra is not _MISSING:
+            log_data["extra"] = extra
+
+        # pydantic-core's Rust encoder (already installed with pydantic)
+        # instead of ``json.dumps``: cheaper per record, and ``fallback=str``
+        # keeps a non-JSON value in ``extra`` from dropping the whole line.
+        return to_json(log_data, fallback=str).decode()
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that keeps records structured for the listener thread.
+
+    The stock :meth:`QueueHandler.prepare` formats the record and drops
+    ``exc_info`` so it can cross a process boundary. The listener here runs
+    in the same process, so only the message is resolved eagerly (callers
+    may mutate ``args`` afterwards) and the exception info is left intact
+    for :class:`JSONFormatter` to serialise.
+    """
 
-        return json.dumps(log_data)
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Resolve the message on the calling thread and enqueue the record."""
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 def setup_logging() -> None:
@@ -108,7 +201,20 @@ def setup_logging() -> None:
     rotated cleanly across day boundaries. The previous design baked the
     startup-time date into the path, which left the handler writing to a
     stale filename indefinitely after the first midnight.
+
+    Both handlers are driven by a :class:`logging.handlers.QueueListener`
+    thread; the root logger only carries a queue handler, so log calls made
+    from request handlers and bulk-download loops cost an in-memory
+    ``put`` instead of a blocking file write.
+
+    Calling it again while the listener is running is a no-op; call
+    :func:`shutdown_logging` first to rebuild the handlers.
     """
+    global _queue_handler, _queue_listener
+
+    if _queue_listener is not None:
+        return
+
     level = logging.DEBUG if settings.debug else logging.INFO
 
     # Ensure logs directory exists
@@ -131,7 +237,6 @@ def setup_logging() -> None:
         utc=True,
     )
     file_handler.setFormatter(JSONFormatter())
-    root_logger.addHandler(file_handler)
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -144,7 +249,41 @@ def setup_logging() -> None:
         )
     else:
         console_handler.setFormatter(JSONFormatter())
-    root_logger.addHandler(console_handler)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_handler = _InProcessQueueHandler(log_queue)
+    root_logger.addHandler(_queue_handler)
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    # The listener thread is a daemon, so records still queued when the
+    # interpreter exits outside the FastAPI lifespan (CLI scripts, a crashed
+    # startup) would be lost. ``atexit`` does not de-duplicate, so drop the
+    # registration from any earlier ``setup_logging`` call first.
+    atexit.unregister(shutdown_logging)
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Stop the background log listener and close its handlers.
+
+    Safe to call when :func:`setup_logging` has not run. The queue handler
+    is detached from the root logger first, then records already queued are
+    written out before the listener thread exits.
+    """
+    global _queue_handler, _queue_listener
+    listener = _queue_listener
+    if listener is None:
+        return
+    _queue_listener = None
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler.close()
+        _queue_handler = None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
 
 
 class ContextLogger:
@@ -204,7 +343,9 @@ class ContextLogger:
         finally:
             duration_ms = (perf_counter() - start) * 1000
             self.info(
-                f"{operation} completed", extra={"duration_ms": round(duration_ms, 2)}
+                "%s completed",
+                operation,
+                extra={"duration_ms": round(duration_ms, 2)},
             )
 
     @asynccontextmanager
@@ -214,14 +355,15 @@ class ContextLogger:
         Args:
             operation: Operation label included in the memory log record.
         """
-        process = psutil.Process()
+        process = _current_process()
         start_mem = process.memory_info().rss
         try:
             yield
         finally:
             end_mem = process.memory_info().rss
             self.info(
-                f"{operation} memory usage",
+                "%s memory usage",
+                operation,
                 extra={
                     "memory_diff_mb": round((end_mem - start_mem) / 1024 / 1024, 2),
                     "total_memory_mb": round(end_mem / 1024 / 1024, 2),
@@ -245,6 +387,11 @@ class ContextLogger:
             exc_info: Whether to attach active exception information.
             **kwargs: Additional keyword arguments forwarded to the wrapped logger.
         """
+        # Same early exit ``Logger.debug`` & co. take, but before the extra
+        # dict is built and the ContextVars are read. ``isEnabledFor`` is
+        # answered from the logger's own level cache.
+        if not self.logger.isEnabledFor(level):
+            return
         extra = kwargs.pop("extra", {})
         correlation_id = _correlation_id_var.get()
         context = _context_var.get()
@@ -254,6 +401,13 @@ class ContextLogger:
             extra.update(context)
         self.logger.log(level, msg, *args, exc_info=exc_info, extra=extra, **kwargs)
 
+    def is_enabled_for(self, level: int) -> bool:
+        """Return whether a record at ``level`` would be emitted.
+
+        Lets call sites skip building expensive log arguments up front.
+        """
+        return self.logger.isEnabledFor(level)
+
     def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log a DEBUG message with the current context."""
         self._log(logging.DEBUG, msg, *args, **kwargs)
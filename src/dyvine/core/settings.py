@@ -31,7 +31,8 @@ addresses.
 from functools import lru_cache
 from typing import Self
 
-from pydantic import Field, model_validator
+from dotenv import load_dotenv
+from pydantic import Field, PrivateAttr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 _DEFAULT_SECRET_SENTINEL = "change-me-in-production"
@@ -279,29 +280,53 @@ class DouyinSettings(BaseSettings):
         ),
     )
 
+    # Memoised ``headers`` / ``proxies`` payloads, keyed on the source
+    # fields so a runtime reassignment (tests, cookie rotation) still
+    # produces a fresh dict on the next read.
+    _headers_cache: tuple[tuple[str, str, str], dict[str, str]] | None = PrivateAttr(
+        default=None
+    )
+    _proxies_cache: (
+        tuple[tuple[str | None, str | None], dict[str, str | None]] | None
+    ) = PrivateAttr(default=None)
+
     @property
     def headers(self) -> dict[str, str]:
         """Generate HTTP headers dictionary for Douyin requests.
 
+        The dict is built once and reused until ``user_agent``, ``referer``
+        or ``cookie`` changes, so callers must treat it as read-only.
+
         Returns:
             Dictionary containing User-Agent, Referer, and Cookie headers
             formatted for use with HTTP clients.
         """
-        return {
-            "User-Agent": self.user_agent,
-            "Referer": self.referer,
-            "Cookie": self.cookie,
-        }
+        key = (self.user_agent, self.referer, self.cookie)
+        cached = self._headers_cache
+        if cached is None or cached[0] != key:
+            cached = (
+                key,
+                {"User-Agent": key[0], "Referer": key[1], "Cookie": key[2]},
+            )
+            self._headers_cache = cached
+        return cached[1]
 
     @property
     def proxies(self) -> dict[str, str | None]:
         """Generate proxy configuration dictionary.
 
+        Cached the same way as ``headers``; treat the result as read-only.
+
         Returns:
             Dictionary containing HTTP and HTTPS proxy URLs,
             compatible with common HTTP client libraries.
         """
-        return {"http://": self.proxy_http, "https://": self.proxy_https}
+        key = (self.proxy_http, self.proxy_https)
+        cached = self._proxies_cache
+        if cached is None or cached[0] != key:
+            cached = (key, {"http://": key[0], "https://": key[1]})
+            self._proxies_cache = cached
+        return cached[1]
 
     model_config = SettingsConfigDict(env_prefix="DOUYIN_")
 
@@ -524,8 +549,6 @@ def get_settings() -> Settings:
         settings = get_settings()
         print(f"Running {settings.project_name} v{settings.version}")
     """
-    from dotenv import load_dotenv
-
     load_dotenv()
     return Settings()
 
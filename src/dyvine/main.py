@@ -20,9 +20,11 @@ Architecture:
 Middleware:
     1. `CORSMiddleware` honours `API_CORS_ORIGINS`; credentialed CORS is
        auto-disabled when the allowlist is `["*"]`.
-    2. `request_middleware` assigns a UUID4 correlation ID per request
+    2. `RequestContextMiddleware` assigns a UUID4 correlation ID per request
        (or accepts a UUID provided via `X-Request-ID`), measures
        duration, and exposes the ID via `X-Correlation-ID`.
+    3. `GZipMiddleware` compresses responses of 500 bytes or more for
+       clients that send `Accept-Encoding: gzip`.
     Exception handlers registered through `register_error_handlers`
     translate `DyvineError` subclasses and `HTTPException` into a
     single error envelope; they are not middleware.
@@ -42,7 +44,7 @@ Examples:
     Production-style::
 
         uv run uvicorn src.dyvine.main:app --host 0.0.0.0 --port 8000 \\
-            --timeout-graceful-shutdown 25
+            --loop uvloop --http httptools --timeout-graceful-shutdown 25
 
     Multi-worker deployments are unsafe today: the default
     `OperationStore` writes to a pod-local SQLite file, so scaling
@@ -51,21 +53,26 @@ Examples:
     base, which uses `Recreate` + `replicas: 1`).
 """
 
+import asyncio
+import logging
+import re
 import time
 import uuid
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from typing import Any
 
 import psutil
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
 from prometheus_client import Counter, Histogram, make_asgi_app
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .core.dependencies import get_service_container
 from .core.error_handlers import register_error_handlers
-from .core.logging import ContextLogger, setup_logging
+from .core.logging import ContextLogger, setup_logging, shutdown_logging
 from .core.path_safety import ensure_within_root, get_task_workspace_root
 from .core.settings import settings
 from .routers import livestreams, posts, users
@@ -83,6 +90,31 @@ http_request_duration_seconds = Histogram(
 logger = ContextLogger(__name__)
 
 
+# Lower-case, dashed UUID as emitted by ``str(uuid.UUID(...))``. Clients that
+# propagate our own IDs or a standard UUID4 match this and skip the parse.
+_CANONICAL_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+)
+
+
+def _request_correlation_id(request: Request) -> str:
+    """Return the correlation ID assigned by ``RequestContextMiddleware``.
+
+    The middleware sets it on every request routed through the app, so the
+    UUID fallback is only generated for requests that bypassed it.
+    """
+    correlation_id = getattr(request.state, "correlation_id", None)
+    if correlation_id is None:
+        correlation_id = str(uuid.uuid4())
+    return correlation_id
+
+
+def _header_value(headers: dict[bytes, bytes], name: bytes) -> str | None:
+    """Return a raw ASGI header as ``str``, or ``None`` when absent."""
+    value = headers.get(name)
+    return value.decode("latin-1") if value is not None else None
+
+
 def _local_retention_workspace_ready() -> bool:
     """Verify the configured task workspace root can be created and written."""
     workspace_root = get_task_workspace_root()
@@ -153,11 +185,21 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # (for log records and the ``timestamp`` field in ``/health``) still go
     # through ``time.time()`` where they are needed.
     app.state.start_monotonic = time.monotonic()
+    # One ``psutil.Process`` for the lifetime of the worker. ``cpu_percent``
+    # reports usage since the previous call on the *same* handle, so a fresh
+    # handle per ``/health`` probe always read 0.0; priming it here makes
+    # each probe report CPU usage over the interval since the last one.
+    app.state.process = psutil.Process()
+    app.state.process.cpu_percent(None)
 
     # Initialize service container with all dependencies
     container = get_service_container()
     await container.initialize()
     app.state.container = container
+    # Build the OpenAPI schema before traffic arrives. FastAPI generates it
+    # lazily on the first ``/docs`` or ``openapi.json`` hit, and for every
+    # router and model that walk runs on the event loop mid-request.
+    app.openapi()
     app.state.startup_complete = True
 
     # Log successful startup with environment context
@@ -168,6 +210,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             "version": settings.version,
             "debug_mode": settings.debug,
             "api_prefix": settings.prefix,
+            "event_loop": type(asyncio.get_running_loop()).__module__,
             "startup_time": time.monotonic() - app.state.start_monotonic,
         },
     )
@@ -202,6 +245,10 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     except Exception:  # pragma: no cover - shutdown is best-effort
         app.state.logger.exception("Service container shutdown failed")
 
+    # Last step so the shutdown records above reach the file before the
+    # listener thread exits.
+    shutdown_logging()
+
 
 # Create FastAPI application instance with comprehensive configuration
 app = FastAPI(
@@ -260,12 +307,13 @@ app.add_middleware(
     allow_methods=["*"],  # Allow all HTTP methods
     allow_headers=["*"],  # Allow all headers
     expose_headers=["X-Correlation-ID"],  # Expose correlation ID to clients
-    max_age=3600,  # Cache preflight responses for 1 hour
+    # Browsers clamp this to their own ceiling (24h Firefox, 2h Chromium);
+    # Starlette already adds ``Vary: Origin`` for an explicit allowlist.
+    max_age=86400,
 )
 
 
-@app.middleware("http")
-async def request_middleware(request: Request, call_next: Any) -> Any:
+class RequestContextMiddleware:
     """HTTP request correlation and logging middleware.
 
     This middleware provides comprehensive request tracking and logging for all
@@ -273,6 +321,13 @@ async def request_middleware(request: Request, call_next: Any) -> Any:
     IDs for request tracing, measures request duration, and logs request/response
     metadata for monitoring and debugging purposes.
 
+    Implemented as a plain ASGI middleware rather than through
+    ``@app.middleware("http")``: Starlette's ``BaseHTTPMiddleware`` runs
+    the downstream app in a separate task and pipes the response through
+    an in-memory stream on every request. Here the app is awaited
+    directly and the correlation header is added to the
+    ``http.response.start`` message on its way out.
+
     Features:
         - Generates unique correlation ID for each request
         - Logs request start with method, path, and client information
@@ -289,13 +344,6 @@ async def request_middleware(request: Request, call_next: Any) -> Any:
         6. Log request completion with performance metrics
         7. Add correlation header to response
 
-    Args:
-        request: Incoming HTTP request object with headers and metadata.
-        call_next: Next middleware or route handler in the processing chain.
-
-    Returns:
-        HTTP response object with added correlation ID header and timing data.
-
     Headers Added:
         X-Correlation-ID: Unique request identifier for tracing and debugging.
 
@@ -326,84 +374,141 @@ async def request_middleware(request: Request, call_next: Any) -> Any:
         ```
 
     """
-    # Determine correlation ID from header or generate a new UUID
-    client_request_id = request.headers.get("X-Request-ID")
-    correlation_id: str
-    request_id_source = "generated"
-    if client_request_id:
-        try:
-            correlation_id = str(uuid.UUID(client_request_id))
-            request_id_source = "client"
-        except ValueError:
-            correlation_id = str(uuid.uuid4())
-            request_id_source = "regenerated"
-    else:
-        correlation_id = str(uuid.uuid4())
-    request.state.correlation_id = correlation_id
-    request.state.request_id_source = request_id_source
-
-    # Configure logger with correlation context
-    logger = app.state.logger
-    logger.set_correlation_id(correlation_id)
-
-    # Record request start time for duration measurement. ``perf_counter``
-    # is monotonic and provides the highest available resolution, which is
-    # the right primitive for an elapsed-time pair where both endpoints are
-    # taken in the same process.
-    start_time = time.perf_counter()
-
-    # Log request initiation with metadata
-    logger.info(
-        "HTTP request initiated",
-        extra={
-            "method": request.method,
-            "path": request.url.path,
-            "query_params": str(request.query_params) if request.query_params else None,
-            "client_ip": request.client.host if request.client else "unknown",
-            "user_agent": request.headers.get("user-agent"),
-            "content_length": request.headers.get("content-length"),
-            "request_id_source": request_id_source,
-        },
-    )
-
-    # Process request through application stack
-    response = await call_next(request)
-
-    # Calculate total processing duration on the same monotonic clock that
-    # captured ``start_time`` above.
-    duration = time.perf_counter() - start_time
-
-    # Log request completion with performance metrics
-    route = request.scope.get("route")
-    route_label = getattr(route, "path", None) or "unmatched"
-    status_code_label = str(response.status_code)
-    logger.info(
-        "HTTP request completed",
-        extra={
-            "status_code": response.status_code,
-            "duration_ms": round(duration * 1000, 2),
-            "content_length": response.headers.get("content-length"),
-            "cache_status": response.headers.get("cache-control"),
-            "request_id_source": request_id_source,
-        },
-    )
-    http_requests_total.labels(
-        method=request.method,
-        route=route_label,
-        status_code=status_code_label,
-    ).inc()
-    http_request_duration_seconds.labels(
-        method=request.method,
-        route=route_label,
-        status_code=status_code_label,
-    ).observe(duration)
 
-    # Add correlation ID to response headers for client tracing
-    response.headers["X-Correlation-ID"] = correlation_id
-    logger.set_correlation_id(None)
-    logger.clear_context()
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # ASGI delivers header names lower-cased; index them once instead of
+        # scanning the list for each header the middleware reads. Building the
+        # dict from the reversed list keeps the first occurrence of a repeated
+        # header, matching the ``Headers.get`` lookup this replaced.
+        request_headers: dict[bytes, bytes] = dict(reversed(scope["headers"]))
+
+        # Determine correlation ID from header or generate a new UUID
+        client_request_id = request_headers.get(b"x-request-id", b"").decode("latin-1")
+        correlation_id: str
+        request_id_source = "generated"
+        if client_request_id:
+            if _CANONICAL_UUID_RE.fullmatch(client_request_id):
+                # Already what ``str(uuid.UUID(...))`` would produce.
+                correlation_id = client_request_id
+                request_id_source = "client"
+            else:
+                try:
+                    correlation_id = str(uuid.UUID(client_request_id))
+                    request_id_source = "client"
+                except ValueError:
+                    correlation_id = str(uuid.uuid4())
+                    request_id_source = "regenerated"
+        else:
+            correlation_id = str(uuid.uuid4())
+        # ``scope["state"]`` backs ``request.state`` for every downstream
+        # ``Request`` built from this scope.
+        state = scope.setdefault("state", {})
+        state["correlation_id"] = correlation_id
+        state["request_id_source"] = request_id_source
+
+        # Configure logger with correlation context
+        logger = app.state.logger
+        logger.set_correlation_id(correlation_id)
+
+        # Record request start time for duration measurement. ``perf_counter``
+        # is monotonic and provides the highest available resolution, which
+        # is the right primitive for an elapsed-time pair where both
+        # endpoints are taken in the same process.
+        start_time = time.perf_counter()
+
+        # Both access-log records are built from the raw scope and skipped
+        # outright when INFO is filtered, so a quiet deployment does not pay
+        # for the extra dicts on every request.
+        log_access = logger.is_enabled_for(logging.INFO)
+        method = scope["method"]
+
+        # Log request initiation with metadata
+        if log_access:
+            client = scope.get("client")
+            logger.info(
+                "HTTP request initiated",
+                extra={
+                    "method": method,
+                    "path": scope["path"],
+                    "query_params": scope["query_string"].decode("latin-1") or None,
+                    "client_ip": client[0] if client else "unknown",
+                    "user_agent": _header_value(request_headers, b"user-agent"),
+                    "content_length": _header_value(request_headers, b"content-length"),
+                    "request_id_source": request_id_source,
+                },
+            )
+
+        response_headers: MutableHeaders | None = None
+        status_code = 500
+
+        async def send_with_correlation_id(message: Message) -> None:
+            nonlocal response_headers, status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add correlation ID to response headers for client tracing
+                response_headers = MutableHeaders(scope=message)
+                response_headers["X-Correlation-ID"] = correlation_id
+            await send(message)
 
-    return response
+        try:
+            # Process request through application stack
+            await self.app(scope, receive, send_with_correlation_id)
+
+            # Calculate total processing duration on the same monotonic clock
+            # that captured ``start_time`` above.
+            duration = time.perf_counter() - start_time
+
+            # Log request completion with performance metrics
+            route = scope.get("route")
+            route_label = getattr(route, "path", None) or "unmatched"
+            status_code_label = str(status_code)
+            if log_access:
+                logger.info(
+                    "HTTP request completed",
+                    extra={
+                        "status_code": status_code,
+                        "duration_ms": round(duration * 1000, 2),
+                        "content_length": (
+                            response_headers.get("content-length")
+                            if response_headers is not None
+                            else None
+                        ),
+                        "cache_status": (
+                            response_headers.get("cache-control")
+                            if response_headers is not None
+                            else None
+                        ),
+                        "request_id_source": request_id_source,
+                    },
+                )
+            http_requests_total.labels(
+                method=method,
+                route=route_label,
+                status_code=status_code_label,
+            ).inc()
+            http_request_duration_seconds.labels(
+                method=method,
+                route=route_label,
+                status_code=status_code_label,
+            ).observe(duration)
+        finally:
+            logger.set_correlation_id(None)
+            logger.clear_context()
+
+
+app.add_middleware(RequestContextMiddleware)
+
+# Registered last so it wraps everything else: the access log above records
+# the uncompressed ``content-length``. Bodies under ``minimum_size`` (probe
+# and error envelopes) are sent as-is.
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
 
 
 # Register error handlers
@@ -420,14 +525,32 @@ metrics_app = make_asgi_app()
 app.mount("/metrics", metrics_app)
 
 
+# Everything in the ``/`` payload is fixed once the routers are mounted, so
+# the body is rendered once here. ``root`` still builds a fresh ``Response``
+# per call because FastAPI attaches the request's background tasks to the
+# returned response object.
+_ROOT_BODY = JSONResponse(
+    content={
+        "name": settings.project_name,
+        "version": settings.version,
+        "docs": "/docs",
+        "redoc": "/redoc",
+        "status": "operational",
+        "api_prefix": settings.prefix,
+        "features": ["users", "posts", "livestreams"],
+    }
+).body
+
+
 @app.get(
     "/",
     summary="API root information",
     description="Returns basic API information and navigation links",
     response_description="API metadata and documentation links",
     tags=["System"],
+    response_class=JSONResponse,
 )
-async def root() -> dict[str, Any]:
+async def root() -> Response:
     """API root endpoint providing basic service information and navigation.
 
     This endpoint serves as the entry point for the Dyvine API, providing
@@ -435,7 +558,7 @@ async def root() -> dict[str, Any]:
     links to interactive documentation.
 
     Returns:
-        Dict[str, Any]: Service metadata including:
+        Response: Pre-rendered JSON service metadata including:
             - name: Human-readable API name
             - version: Current API version (semantic versioning)
             - docs: URL path to Swagger/OpenAPI documentation
@@ -467,15 +590,7 @@ async def root() -> dict[str, Any]:
         It's commonly used for service discovery and API health verification.
 
     """
-    return {
-        "name": settings.project_name,
-        "version": settings.version,
-        "docs": "/docs",
-        "redoc": "/redoc",
-        "status": "operational",
-        "api_prefix": settings.prefix,
-        "features": ["users", "posts", "livestreams"],
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get(
@@ -487,7 +602,7 @@ async def root() -> dict[str, Any]:
 )
 async def liveness_probe(request: Request) -> JSONResponse:
     """Return a liveness signal that only reflects process health."""
-    correlation_id = getattr(request.state, "correlation_id", str(uuid.uuid4()))
+    correlation_id = _request_correlation_id(request)
     return JSONResponse(
         status_code=status.HTTP_200_OK,
         content={
@@ -513,7 +628,7 @@ async def readiness_probe(request: Request) -> JSONResponse:
     The checks are intentionally conservative: a Pod that cannot accept
     work must not be routed traffic by the orchestrator.
     """
-    correlation_id = getattr(request.state, "correlation_id", str(uuid.uuid4()))
+    correlation_id = _request_correlation_id(request)
 
     # Douyin API authentication cookie must be configured to reach upstream.
     douyin_ok = bool(settings.douyin.cookie)
@@ -591,7 +706,7 @@ async def readiness_probe(request: Request) -> JSONResponse:
 )
 async def startup_probe(request: Request) -> JSONResponse:
     """Return whether the application startup sequence completed."""
-    correlation_id = getattr(request.state, "correlation_id", str(uuid.uuid4()))
+    correlation_id = _request_correlation_id(request)
     started = bool(getattr(app.state, "startup_complete", False))
     startup_status_code = (
         status.HTTP_200_OK if started else status.HTTP_503_SERVICE_UNAVAILABLE
@@ -605,6 +720,18 @@ async def startup_probe(request: Request) -> JSONResponse:
     )
 
 
+@app.head("/health", include_in_schema=False)
+async def health_check_head() -> Response:
+    """Answer ``HEAD /health`` with the ``GET`` status and no body.
+
+    Pollers that only check the status line skip the psutil sampling, and
+    the ``cpu_percent`` interval of the next ``GET`` is left untouched.
+    Kept as its own route so the OpenAPI schema has a single ``/health``
+    operation with a unique ID.
+    """
+    return Response(status_code=status.HTTP_200_OK)
+
+
 @app.get(
     "/health",
     summary="Application health summary",
@@ -642,7 +769,7 @@ async def health_check(request: Request) -> JSONResponse:
               produce negative or jumping values.
             - uptime_human: Human-readable rendering of ``uptime_seconds``.
             - memory_mb: Resident memory of the current process in MiB.
-            - cpu_percent: Instantaneous CPU usage percentage.
+            - cpu_percent: CPU usage percentage since the previous probe.
             - timestamp: Wall-clock timestamp (``time.time()``) of the
               snapshot, intended for log correlation.
             - api_prefix: Configured API prefix.
@@ -654,6 +781,8 @@ async def health_check(request: Request) -> JSONResponse:
             - memory_pressure: ``"high"`` when RSS exceeds 1 GiB, else
               ``"normal"``. Informational only.
 
+    ``HEAD /health`` is served by :func:`health_check_head`.
+
     Status Codes:
         - 200: Always.
 
@@ -683,8 +812,8 @@ async def health_check(request: Request) -> JSONResponse:
         ```
 
     """
-    # Get current process information
-    process = psutil.Process()
+    # Reuse the handle primed in the lifespan; see the note there.
+    process = getattr(app.state, "process", None) or psutil.Process()
     # ``start_monotonic`` is set at the top of the lifespan startup hook,
     # which always runs before any HTTP request. The ``getattr`` fallback
     # protects exotic call paths (e.g. tests instantiating ``app`` without
@@ -719,7 +848,7 @@ async def health_check(request: Request) -> JSONResponse:
     rss_bytes = process.memory_info().rss
     memory_pressure = "high" if rss_bytes > 1024 * 1024 * 1024 else "normal"
 
-    correlation_id = getattr(request.state, "correlation_id", str(uuid.uuid4()))
+    correlation_id = _request_correlation_id(request)
 
     response_body = {
         "status": "ok",
@@ -7,6 +7,10 @@ Endpoints exposed under ``/api/v1/livestreams``:
 - ``POST /stream:download`` — schedule a livestream download from an
   arbitrary URL. The schema validator restricts the host to the
   ``douyin.com`` family to prevent SSRF.
+- ``POST /stream:batchDownload`` — schedule up to
+  ``MAX_BATCH_DOWNLOAD_ITEMS`` URL downloads in one request. Items run
+  concurrently through the single-URL handler and each gets its own
+  result, so one offline room does not fail the whole batch.
 - ``GET /operations/{operation_id}`` — poll the persisted operation
   record for a download in progress or already completed.
 
@@ -16,15 +20,20 @@ Endpoints exposed under ``/api/v1/livestreams``:
 500 the global ``ServiceError`` mapping would otherwise produce.
 """
 
+import asyncio
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, Path, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, status
 
 from ..core.decorators import handle_errors
 from ..core.dependencies import get_livestream_service, require_api_key
 from ..core.exceptions import LivestreamError
 from ..core.logging import ContextLogger
 from ..schemas.livestreams import (
+    LiveStreamBatchDownloadItem,
+    LiveStreamBatchDownloadRequest,
+    LiveStreamBatchDownloadResponse,
+    LiveStreamBatchDownloadResult,
     LiveStreamDownloadResponse,
     LiveStreamURLDownloadRequest,
 )
@@ -111,6 +120,59 @@ async def download_livestream_url(
         )
 
 
+async def _download_batch_item(
+    item: LiveStreamBatchDownloadItem, service: LivestreamService
+) -> LiveStreamBatchDownloadResult:
+    """Run one batch item through ``download_livestream_url``.
+
+    Reusing the single-URL handler keeps the error mapping, logging and
+    5xx message redaction identical; its ``HTTPException`` is folded into
+    the item's result instead of failing the batch.
+    """
+    try:
+        operation = await download_livestream_url(request=item, service=service)
+    except HTTPException as exc:
+        detail = exc.detail
+        return LiveStreamBatchDownloadResult(
+            id=item.id,
+            status_code=exc.status_code,
+            operation=None,
+            error=detail["error"] if isinstance(detail, dict) else str(detail),
+        )
+    return LiveStreamBatchDownloadResult(
+        id=item.id,
+        status_code=status.HTTP_202_ACCEPTED,
+        operation=operation,
+        error=None,
+    )
+
+
+@router.post(
+    "/stream:batchDownload",
+    response_model=LiveStreamBatchDownloadResponse,
+    responses={
+        401: {"description": "Missing or invalid API key"},
+        422: {"description": "Invalid item, duplicate id, or too many items"},
+    },
+)
+@handle_errors(logger=logger)
+async def download_livestreams_batch(
+    request: LiveStreamBatchDownloadRequest,
+    service: Annotated[LivestreamService, Depends(get_livestream_service)],
+) -> LiveStreamBatchDownloadResponse:
+    """Schedules several livestream downloads from direct URLs."""
+    logger.info(
+        "Processing download_livestreams_batch request",
+        extra={"item_count": len(request.items)},
+    )
+
+    async with logger.track_time("download_livestreams_batch"):
+        results = await asyncio.gather(
+            *(_download_batch_item(item, service) for item in request.items)
+        )
+    return LiveStreamBatchDownloadResponse(results=results)
+
+
 @router.get(
     "/operations/{operation_id}",
     response_model=LiveStreamDownloadResponse,
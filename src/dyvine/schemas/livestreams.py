@@ -11,6 +11,10 @@ Provides:
   against the `douyin.com` allowlist to prevent SSRF and rejects
   output paths that contain absolute prefixes or `..` segments.
 - `LiveStreamDownloadResponse` — alias for `OperationResponse`.
+- `LiveStreamBatchDownloadRequest` / `LiveStreamBatchDownloadResponse` —
+  body and result for `POST /livestreams/stream:batchDownload`, which
+  schedules several URL downloads in one call. Each item carries a
+  client-chosen `id` that is echoed back on its result.
 
 The schema-layer `output_path` validator is intentionally cheap: the
 authoritative jail check (including symlink-segment scanning before
@@ -29,6 +33,11 @@ from .operations import OperationResponse
 
 _USER_ID_PATTERN = r"^[A-Za-z0-9_\-]{6,128}$"
 
+# Upper bound on items per batch request. Every item resolves its room
+# against the upstream API concurrently, so the cap also bounds the
+# fan-out a single request can trigger.
+MAX_BATCH_DOWNLOAD_ITEMS = 20
+
 # Hostnames the livestream URL endpoint is allowed to point at. Anything
 # else is rejected at the schema layer so the service never builds an
 # outbound HTTP request to an attacker-controlled host (SSRF).
@@ -145,3 +154,77 @@ class LiveStreamURLDownloadRequest(BaseModel):
 
 class LiveStreamDownloadResponse(OperationResponse):
     """Backward-compatible alias for livestream download operations."""
+
+
+class LiveStreamBatchDownloadItem(LiveStreamURLDownloadRequest):
+    """One entry of a batch livestream download request.
+
+    Attributes:
+        id: Client-chosen identifier echoed back on the matching result.
+    """
+
+    id: str = Field(
+        ...,
+        min_length=1,
+        max_length=128,
+        description="Client-chosen identifier echoed back on the result",
+    )
+
+
+class LiveStreamBatchDownloadRequest(BaseModel):
+    """Request model for scheduling several URL downloads at once.
+
+    Attributes:
+        items: Downloads to schedule; ``id`` values must be unique.
+    """
+
+    items: list[LiveStreamBatchDownloadItem] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_DOWNLOAD_ITEMS,
+        description=(
+            f"Between 1 and {MAX_BATCH_DOWNLOAD_ITEMS} downloads with unique ids"
+        ),
+    )
+
+    @field_validator("items")
+    @classmethod
+    def _check_unique_ids(
+        cls, value: list[LiveStreamBatchDownloadItem]
+    ) -> list[LiveStreamBatchDownloadItem]:
+        """Reject batches where two items share an ``id``."""
+        if len({item.id for item in value}) != len(value):
+            raise ValueError("item ids must be unique within a batch")
+        return value
+
+
+class LiveStreamBatchDownloadResult(BaseModel):
+    """Outcome of a single batch item.
+
+    Attributes:
+        id: The ``id`` of the request item this result belongs to.
+        status_code: Status the single-item endpoint would have returned.
+        operation: Scheduled operation when ``status_code`` is 202.
+        error: Client-facing error message otherwise.
+    """
+
+    id: str = Field(..., description="Identifier of the matching request item")
+    status_code: int = Field(
+        ..., description="Status the single-item endpoint would have returned"
+    )
+    operation: LiveStreamDownloadResponse | None = Field(
+        None, description="Scheduled operation for accepted items"
+    )
+    error: str | None = Field(None, description="Error message for rejected items")
+
+
+class LiveStreamBatchDownloadResponse(BaseModel):
+    """Response model for a batch livestream download request.
+
+    Attributes:
+        results: One result per request item, in request order.
+    """
+
+    results: list[LiveStreamBatchDownloadResult] = Field(
+        ..., description="One result per request item, in request order"
+    )
@@ -178,15 +178,7 @@ class BulkDownloadResponse(BaseModel):
     )
     total_posts: int = Field(default=0, description="Total number of posts available")
     downloaded_count: dict[PostType, int] = Field(
-        default_factory=lambda: {
-            PostType.VIDEO: 0,
-            PostType.IMAGES: 0,
-            PostType.MIXED: 0,
-            PostType.LIVE: 0,
-            PostType.COLLECTION: 0,
-            PostType.STORY: 0,
-            PostType.UNKNOWN: 0,
-        },
+        default_factory=lambda: dict.fromkeys(PostType, 0),
         description="Count of downloads by post type",
     )
     failed_count: int = Field(
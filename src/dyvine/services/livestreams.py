@@ -21,11 +21,10 @@
 import asyncio
 import json
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
 from f2.apps.douyin.dl import DouyinDownloader  # type: ignore
-from f2.apps.douyin.handler import DouyinHandler  # type: ignore
 from f2.apps.douyin.utils import WebCastIdFetcher  # type: ignore
 from f2.exceptions.api_exceptions import APIResponseError  # type: ignore
 
@@ -46,6 +45,11 @@ from ..core.settings import settings
 from ..schemas.livestreams import LiveStreamDownloadResponse
 from .users import UserService
 
+if TYPE_CHECKING:
+    # Annotation-only: the handler instance is injected by the service
+    # container, so this module never needs the class at runtime.
+    from f2.apps.douyin.handler import DouyinHandler  # type: ignore
+
 logger = ContextLogger(__name__)
 
 __all__ = [
@@ -84,7 +88,7 @@ class LivestreamService:
     def __init__(
         self,
         *,
-        douyin_handler: DouyinHandler,
+        douyin_handler: "DouyinHandler",
         user_service: UserService,
         operation_store: OperationStore,
         task_registry: BackgroundTaskRegistry | None = None,
@@ -28,13 +28,14 @@ when downloads already succeeded) rather than silently passing as
 ``completed``.
 """
 
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from f2.apps.douyin.db import AsyncUserDB  # type: ignore
-from f2.apps.douyin.handler import DouyinHandler  # type: ignore
 
 from ..core.background import BackgroundTaskRegistry, spawn_or_fallback
 from ..core.exceptions import (
@@ -56,6 +57,11 @@ from ..schemas.posts import (
     VideoInfo,
 )
 
+if TYPE_CHECKING:
+    # Annotation-only: the handler instance is injected by the service
+    # container, so this module never needs the class at runtime.
+    from f2.apps.douyin.handler import DouyinHandler  # type: ignore
+
 logger = ContextLogger(__name__)
 
 # Alias for backward compatibility
@@ -68,6 +74,18 @@ PostServiceError = ServiceError
 # items when ``total_posts`` is unknown.
 PAGE_SIZE = 20
 
+# Repeat bulk downloads of the same account reuse the resolved f2 user
+# directory for this long instead of reopening ``douyin_users.db`` and
+# letting ``get_or_add_user_data`` refetch the profile. Short enough that a
+# nickname change (which renames the folder upstream) is picked up quickly.
+USER_PATH_CACHE_TTL_SECONDS = 60.0
+USER_PATH_CACHE_MAX_ENTRIES = 256
+
+# Accepted URL schemes for media links. A bare ``"http"`` prefix would also
+# admit strings such as ``"httpfoo://"``; the tuple form keeps the check a
+# single C-level ``startswith`` call.
+_HTTP_PREFIXES = ("http://", "https://")
+
 
 @dataclass(slots=True)
 class UserPostsPage:
@@ -113,10 +131,17 @@ class PostService:
     # ``__init__``) still see a ``None`` registry and fall through to the bare
     # ``asyncio.create_task`` branch in :func:`spawn_or_fallback`.
     _task_registry: BackgroundTaskRegistry | None = None
+    # Lazily created per instance by ``_resolve_user_path`` (the class-level
+    # ``None`` keeps ``object.__new__``-built test doubles working).
+    _user_path_cache: OrderedDict[str, tuple[float, Path]] | None = None
+    # f2 user database, opened on the first cache miss and kept for the
+    # lifetime of the service; ``close`` releases it on container shutdown.
+    _user_db_cm: Any = None
+    _user_db: Any = None
 
     def __init__(
         self,
-        handler: DouyinHandler,
+        handler: "DouyinHandler",
         *,
         operation_store: OperationStore | None = None,
         task_registry: BackgroundTaskRegistry | None = None,
@@ -454,18 +479,14 @@ class PostService:
             )
 
             # Set up user directory
-            async with AsyncUserDB("douyin_users.db") as db:
-                user_path = await self.handler.get_or_add_user_data(
-                    self.handler.kwargs, sec_user_id, db
-                )
-                # Persist the path relative to the configured download
-                # root so the public API surface never leaks the on-disk
-                # absolute layout.
-                download_path = relative_to_download_root(user_path)
-                logger.info(
-                    "Download directory created",
-                    extra={"download_path": download_path},
-                )
+            user_path = await self._resolve_user_path(sec_user_id)
+            # Persist the path relative to the configured download root so
+            # the public API surface never leaks the on-disk absolute layout.
+            download_path = relative_to_download_root(user_path)
+            logger.info(
+                "Download directory created",
+                extra={"download_path": download_path},
+            )
             await self.operation_store.update_operation(
                 operation_id,
                 download_path=download_path,
@@ -747,6 +768,66 @@ class PostService:
             error_details=op.error,
         )
 
+    async def _resolve_user_path(self, sec_user_id: str) -> Path:
+        """Return the f2 download directory for ``sec_user_id``.
+
+        ``handler.get_or_add_user_data`` opens the f2 user database and
+        issues its own ``fetch_user_profile`` call every time, so the result
+        is kept in a small LRU for ``USER_PATH_CACHE_TTL_SECONDS``. Two
+        concurrent misses for the same user both resolve the directory;
+        that is idempotent upstream, so no per-key lock is taken.
+        """
+        cache = self._user_path_cache
+        if cache is None:
+            cache = self._user_path_cache = OrderedDict()
+
+        now = time.monotonic()
+        cached = cache.get(sec_user_id)
+        if cached is not None and now - cached[0] < USER_PATH_CACHE_TTL_SECONDS:
+            cache.move_to_end(sec_user_id)
+            return cached[1]
+
+        db = await self._get_user_db()
+        user_path: Path = await self.handler.get_or_add_user_data(
+            self.handler.kwargs, sec_user_id, db
+        )
+        cache[sec_user_id] = (now, user_path)
+        cache.move_to_end(sec_user_id)
+        while len(cache) > USER_PATH_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+        return user_path
+
+    async def _get_user_db(self) -> Any:
+        """Return the shared f2 user database connection, opening it once.
+
+        Reopening ``douyin_users.db`` per bulk download paid for a fresh
+        sqlite connection and f2's table bootstrap every time. aiosqlite
+        funnels every statement through the connection's worker thread, so
+        concurrent bulk downloads can share one connection safely.
+        """
+        if self._user_db is not None:
+            return self._user_db
+        cm = AsyncUserDB("douyin_users.db")
+        db = await cm.__aenter__()
+        if self._user_db is not None:
+            # Another bulk download opened it while this one was awaiting.
+            await cm.__aexit__(None, None, None)
+            return self._user_db
+        self._user_db_cm, self._user_db = cm, db
+        return db
+
+    async def close(self) -> None:
+        """Close the shared f2 user database connection, if one was opened.
+
+        Called from ``ServiceContainer.shutdown`` once background bulk
+        downloads have drained. Safe to call more than once.
+        """
+        cm = self._user_db_cm
+        if cm is None:
+            return
+        self._user_db_cm = self._user_db = None
+        await cm.__aexit__(None, None, None)
+
     async def _fetch_posts_batch(
         self,
         sec_user_id: str,
@@ -778,7 +859,9 @@ class PostService:
             raw_data = _mapping_from(posts_filter, "_to_raw")
             list_data = _list_from(posts_filter, "_to_list")
             if list_data:
-                batch_data = dict(raw_data or {})
+                # ``raw_data`` is already a private copy; reuse it as the
+                # envelope instead of copying the page a second time.
+                batch_data = raw_data if raw_data is not None else {}
                 batch_data["aweme_list"] = list_data
                 return batch_data
 
@@ -820,6 +903,13 @@ class PostService:
         logger.info("Processing posts batch", extra={"post_count": len(post_list)})
 
         failed = 0
+        # Posts are dispatched one at a time on purpose. f2's downloader
+        # keeps per-call state on the instance (``base_path``, ``aweme_id``
+        # and the shared ``download_tasks`` list that ``execute_tasks``
+        # drains and clears), so overlapping ``create_download_tasks``
+        # calls on the shared handler would write files under the wrong
+        # post and misattribute failures. The files *within* a post are
+        # already fetched concurrently behind f2's ``max_tasks`` semaphore.
         for post in post_list:
             try:
                 post_type = self._determine_post_type(post)
@@ -855,10 +945,11 @@ class PostService:
             elif aweme_type == 4:
                 return PostType.STORY
 
-            # Check for images and videos
+            # Check for images and videos (upstream may send ``"video": null``)
             has_images = bool(post.get("images"))
             has_video = bool(
-                post.get("video_play_addr") or post.get("video", {}).get("play_addr")
+                post.get("video_play_addr")
+                or (post.get("video") or {}).get("play_addr")
             )
 
             if has_images and has_video:
@@ -887,9 +978,10 @@ class PostService:
             user_path (Path): Path to the user's directory for saving
                 downloaded content.
         """
+        aweme_id = post.get("aweme_id")
         logger.info(
             "Downloading post content",
-            extra={"aweme_id": post.get("aweme_id"), "post_type": post_type},
+            extra={"aweme_id": aweme_id, "post_type": post_type},
         )
 
         try:
@@ -902,7 +994,7 @@ class PostService:
             logger.error(
                 "Error downloading content",
                 extra={
-                    "aweme_id": post.get("aweme_id"),
+                    "aweme_id": aweme_id,
                     "post_type": post_type,
                     "error": str(e),
                 },
@@ -918,19 +1010,23 @@ class PostService:
         Returns:
             List[str]: List of image URLs extracted from the post.
         """
-        image_urls = []
-        images = post.get("images", [])
-        if isinstance(images, list):
-            for img in images:
-                if isinstance(img, dict) and img.get("url_list"):
-                    image_urls.extend(
-                        [
-                            url
-                            for url in img["url_list"]
-                            if url and url.startswith("http")
-                        ]
-                    )
-        return image_urls
+        images = post.get("images")
+        if not isinstance(images, list):
+            return []
+        # Upstream entries are dicts in practice, so index directly and let
+        # the rare malformed entry (a bare string, a dict without
+        # ``url_list``) fall out through the exception instead of paying an
+        # ``isinstance`` check on every image.
+        urls: list[str] = []
+        for img in images:
+            try:
+                url_list = img["url_list"]
+            except (KeyError, TypeError):
+                continue
+            for url in url_list or ():
+                if url and url.startswith(_HTTP_PREFIXES):
+                    urls.append(url)
+        return urls
 
     def _extract_video_info(self, post: dict[str, Any]) -> VideoInfo | None:
         """Extract video information from a Douyin post.
@@ -1000,14 +1096,19 @@ def _mapping_from(obj: Any, method_name: str) -> dict[str, Any] | None:
 
 
 def _list_from(obj: Any, method_name: str) -> list[dict[str, Any]] | None:
-    """Return a list of dictionaries from a zero-argument conversion method."""
+    """Return a list of dictionaries from a zero-argument conversion method.
+
+    Items are passed through without a per-item copy: f2's ``_to_list``
+    builds fresh dicts on every call, and ``_prepare_post_for_downloader``
+    copies each post before adding downloader fields.
+    """
     method = getattr(obj, method_name, None)
     if not callable(method):
         return None
     value = method()
     if not isinstance(value, list):
         return None
-    items = [dict(item) for item in value if isinstance(item, dict)]
+    items = [item for item in value if isinstance(item, dict)]
     return items or None
 
 
@@ -1105,10 +1206,12 @@ def _image_video_urls_from_raw_post(post: dict[str, Any]) -> list[str | list[str
 def _url_list_from(value: Any) -> list[str]:
     """Return HTTP URLs from a string, list, or Douyin URL container dict."""
     if isinstance(value, str):
-        return [value] if value.startswith("http") else []
+        return [value] if value.startswith(_HTTP_PREFIXES) else []
     if isinstance(value, list):
         return [
-            item for item in value if isinstance(item, str) and item.startswith("http")
+            item
+            for item in value
+            if isinstance(item, str) and item.startswith(_HTTP_PREFIXES)
         ]
     if isinstance(value, dict):
         return _url_list_from(value.get("url_list"))
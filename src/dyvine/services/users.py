@@ -20,9 +20,9 @@ operation row with a clamped ``progress`` value plus a terminal
 (``DOUYIN_RETAIN_LOCAL_DOWNLOADS``, or whenever R2 is unconfigured) it is
 kept and trimmed to an optional size cap instead.
 
-External dependencies are wrapped in `try`/`finally`:
-``DouyinHandler`` is closed via ``_safely_close_handler`` to avoid
-file-descriptor leaks across heavy polling, and ``shutil.rmtree``
+External dependencies are cleaned up explicitly: the shared profile
+``DouyinHandler`` is closed via ``core.douyin.close_handler_downloader``
+from ``UserService.close`` at container shutdown, and ``shutil.rmtree``
 uses ``onexc`` to log per-entry failures without masking the
 original exception.
 """
@@ -39,6 +39,7 @@ from f2.apps.douyin.handler import DouyinHandler  # type: ignore
 from pydantic import AnyHttpUrl
 
 from ..core.background import BackgroundTaskRegistry, spawn_or_fallback
+from ..core.douyin import close_handler_downloader
 from ..core.exceptions import (
     DownloadError,
     OperationNotFoundError,
@@ -151,38 +152,6 @@ def _parse_room_data(raw: Any) -> dict[str, Any] | None:
     return None
 
 
-async def _safely_close_handler(handler: DouyinHandler) -> None:
-    """Best-effort close of a DouyinHandler instance.
-
-    The upstream ``f2`` SDK does not document a stable ``close`` API: some
-    revisions expose ``aclose`` on the wrapped httpx client, others rely
-    on garbage collection. Trying every common shape lets us release file
-    descriptors today while keeping the helper safe to call against
-    future SDK revisions that change the surface again.
-    """
-    for attr in ("aclose", "close"):
-        target = getattr(handler, attr, None)
-        if callable(target):
-            try:
-                result = target()
-                if asyncio.iscoroutine(result):
-                    await result
-                return
-            except Exception:  # pragma: no cover - defensive cleanup
-                logger.debug(
-                    "DouyinHandler close raised; ignoring",
-                    extra={"close_method": attr},
-                )
-                return
-    client = getattr(handler, "client", None)
-    aclose = getattr(client, "aclose", None)
-    if callable(aclose):
-        try:
-            await aclose()
-        except Exception:  # pragma: no cover - defensive cleanup
-            logger.debug("Underlying httpx client close raised; ignoring")
-
-
 logger = ContextLogger(__name__)
 
 # Alias for backward compatibility
@@ -227,16 +196,52 @@ class UserService:
         self.operation_store = operation_store or OperationStore()
         self.storage = R2StorageService()
         self._task_registry = task_registry
+        self._profile_handler: DouyinHandler | None = None
+
+    def _get_profile_handler(self) -> DouyinHandler:
+        """Return the shared handler used for profile lookups.
+
+        ``DouyinHandler.__init__`` builds a ``DouyinDownloader`` and a Bark
+        notification client, which is wasted work on every profile request.
+        ``fetch_user_profile`` opens its own crawler per call and never reads
+        the ``url`` kwarg, so a single handler is safe to reuse across
+        concurrent lookups. Bulk downloads keep building their own handler
+        because their kwargs (``path``, ``max_counts``...) are per task.
+        The handler's HTTP client is released by :meth:`close`.
+        """
+        if self._profile_handler is None:
+            self._profile_handler = DouyinHandler(
+                {
+                    "cookie": settings.douyin_cookie,
+                    "headers": {
+                        "User-Agent": settings.douyin_user_agent,
+                        "Referer": settings.douyin_referer,
+                    },
+                    "proxy": settings.douyin_proxy_http,
+                    "mode": "post",
+                }
+            )
+        return self._profile_handler
+
+    async def close(self) -> None:
+        """Close the shared profile handler, if one was created.
+
+        Called from ``ServiceContainer.shutdown`` next to
+        ``PostService.close``. Safe to call more than once.
+        """
+        handler = self._profile_handler
+        if handler is None:
+            return
+        self._profile_handler = None
+        await close_handler_downloader(handler)
 
     async def get_user_info(self, user_id: str) -> UserResponse:
         """Retrieve user information from Douyin.
 
-        The DouyinHandler instance is closed in a ``finally`` block so the
-        underlying httpx client does not leak file descriptors when the
-        endpoint is polled (livestream availability, profile refreshes,
-        etc.). Older revisions instantiated a fresh handler per call and
-        relied on garbage collection, which under sustained polling
-        eventually exhausted the per-process FD limit.
+        Lookups share one ``DouyinHandler`` (see ``_get_profile_handler``)
+        that lives until :meth:`close`. Older revisions instantiated a fresh
+        handler per call, which under sustained polling leaked one httpx
+        client per request.
 
         Args:
             user_id: The Douyin user ID.
@@ -248,18 +253,7 @@ class UserService:
             UserNotFoundError: If the requested user cannot be found.
             UserServiceError: If an error occurs during the operation.
         """
-        handler_kwargs = {
-            "url": f"https://www.douyin.com/user/{user_id}",
-            "cookie": settings.douyin_cookie,
-            "headers": {
-                "User-Agent": settings.douyin_user_agent,
-                "Referer": settings.douyin_referer,
-            },
-            "proxy": settings.douyin_proxy_http,
-            "mode": "post",
-        }
-
-        handler = DouyinHandler(handler_kwargs)
+        handler = self._get_profile_handler()
         try:
             user_data = await handler.fetch_user_profile(user_id)
 
@@ -292,8 +286,6 @@ class UserService:
         except Exception as e:
             logger.exception("Failed to get user info", extra={"user_id": user_id})
             raise UserServiceError(f"Failed to get user info: {str(e)}") from e
-        finally:
-            await _safely_close_handler(handler)
 
     async def start_download(
         self,
@@ -43,7 +43,7 @@ def reset_singletons(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     otherwise make ``SecuritySettings`` tests assert against a live secret
     instead of the documented ``change-me-in-production`` sentinel.
     """
-    from dyvine.core.dependencies import get_service_container
+    from dyvine.core.dependencies import reset_service_container
     from dyvine.core.settings import get_settings, settings
 
     monkeypatch.delenv("SECURITY_SECRET_KEY", raising=False)
@@ -58,10 +58,10 @@ def reset_singletons(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     # instance leaked from a previous test. Clearing both cached
     # singletons keeps the per-test isolation honest.
     get_settings.cache_clear()
-    get_service_container.cache_clear()
+    reset_service_container()
     yield
     get_settings.cache_clear()
-    get_service_container.cache_clear()
+    reset_service_container()
 
 
 @pytest.fixture
@@ -0,0 +1,52 @@
+"""Tests for shared ``DouyinHandler`` lifecycle helpers."""
+
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from dyvine.core.douyin import close_handler_downloader
+
+
+@pytest.mark.asyncio
+async def test_close_handler_downloader_awaits_async_close() -> None:
+    """An async ``downloader.close`` is awaited exactly once."""
+    downloader = AsyncMock()
+    handler = SimpleNamespace(downloader=downloader)
+
+    await close_handler_downloader(handler)
+
+    downloader.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_close_handler_downloader_tolerates_missing_or_sync_close() -> None:
+    """Handlers without a downloader, or with a sync ``close``, are fine."""
+    await close_handler_downloader(SimpleNamespace())
+
+    downloader = MagicMock()
+    await close_handler_downloader(SimpleNamespace(downloader=downloader))
+
+    downloader.close.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_close_handler_downloader_logs_failure(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """A failing ``close`` is logged as a warning instead of raising."""
+    downloader = AsyncMock()
+    downloader.close.side_effect = RuntimeError("boom")
+    handler = SimpleNamespace(downloader=downloader)
+
+    with caplog.at_level(logging.WARNING, logger="dyvine.core.douyin"):
+        await close_handler_downloader(handler)
+
+    assert any(
+        record.getMessage() == "Failed to close Douyin downloader"
+        and record.exc_info is not None
+        for record in caplog.records
+    )
@@ -8,6 +8,7 @@ from unittest.mock import MagicMock
 import pytest
 from fastapi import HTTPException
 
+from dyvine.core import error_handlers
 from dyvine.core.error_handlers import (
     ErrorResponse,
     dyvine_error_handler,
@@ -22,6 +23,12 @@ from dyvine.core.exceptions import (
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_status_code_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give every test an empty per-type status cache."""
+    monkeypatch.setattr(error_handlers, "_status_code_by_type", {})
+
+
 def _make_request(correlation_id: str | None = None) -> MagicMock:
     """Test helper for this module."""
     req = MagicMock()
@@ -95,6 +102,23 @@ async def test_dyvine_error_handler_not_found_returns_404() -> None:
     assert resp.status_code == 404
 
 
+@pytest.mark.asyncio
+async def test_dyvine_error_handler_reuses_resolved_status_code(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Repeat errors of one type reuse the status resolved the first time."""
+    req = _make_request("cid-1")
+    first = await dyvine_error_handler(req, UserNotFoundError("gone"))
+
+    # With the mapping emptied, only a cached lookup can still yield 404.
+    monkeypatch.setattr(error_handlers, "_DYVINE_STATUS_MAPPING", ())
+    second = await dyvine_error_handler(req, UserNotFoundError("gone again"))
+    uncached = await dyvine_error_handler(req, ServiceError("boom"))
+
+    assert first.status_code == second.status_code == 404
+    assert uncached.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_dyvine_error_handler_service_error_returns_500() -> None:
     """Verify dyvine error handler service error returns 500."""
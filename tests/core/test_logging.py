@@ -74,6 +74,24 @@ def test_json_formatter_includes_exception_info() -> None:
     assert data["exception"]["type"] == "ValueError"
 
 
+def test_json_formatter_formats_traceback_once_per_record() -> None:
+    """A second handler's formatter reuses the cached ``exc_text``."""
+    import sys
+
+    try:
+        raise ValueError("cached")
+    except ValueError:
+        record = _make_record("err", logging.ERROR, sys.exc_info())
+
+    first, second = JSONFormatter(), JSONFormatter()
+    with patch.object(
+        second, "formatException", side_effect=AssertionError("re-formatted")
+    ):
+        out_one = json.loads(first.format(record))
+        out_two = json.loads(second.format(record))
+    assert out_one["exception"]["traceback"] == out_two["exception"]["traceback"]
+
+
 def test_json_formatter_includes_correlation_id() -> None:
     """Verify JSON formatter includes correlation ID."""
     fmt = JSONFormatter()
@@ -118,6 +136,7 @@ def test_context_logger_add_context_stores_values() -> None:
 def test_context_logger_log_includes_correlation_id() -> None:
     """Verify context logger log includes correlation ID."""
     cl = ContextLogger("test.corr")
+    cl.logger.setLevel(logging.DEBUG)
     cl.set_correlation_id("cid-test")
     with patch.object(cl.logger, "log") as mock_log:
         cl.info("msg")
@@ -128,6 +147,7 @@ def test_context_logger_log_includes_correlation_id() -> None:
 def test_context_logger_log_includes_context() -> None:
     """Verify context logger log includes context."""
     cl = ContextLogger("test.ctx")
+    cl.logger.setLevel(logging.DEBUG)
     cl.add_context(env="dev")
     with patch.object(cl.logger, "log") as mock_log:
         cl.info("msg")
@@ -139,6 +159,7 @@ def test_context_logger_log_includes_context() -> None:
 async def test_track_time_logs_duration() -> None:
     """Verify track time logs duration."""
     cl = ContextLogger("test.time")
+    cl.logger.setLevel(logging.DEBUG)
     with patch.object(cl.logger, "log") as mock_log:
         async with cl.track_time("op"):
             pass
@@ -158,7 +179,9 @@ async def test_track_memory_logs_memory_diff() -> None:
     mock_process.memory_info = MagicMock(side_effect=[mem_start, mem_end])
 
     cl = ContextLogger("test.mem")
+    cl.logger.setLevel(logging.DEBUG)
     with (
+        patch.object(dyvine_logging, "_process", None),
         patch("psutil.Process", return_value=mock_process),
         patch.object(cl.logger, "log") as mock_log,
     ):
@@ -170,9 +193,31 @@ async def test_track_memory_logs_memory_diff() -> None:
         assert "total_memory_mb" in extra
 
 
+def test_current_process_handle_is_reused() -> None:
+    """``track_memory`` samples through one cached ``psutil.Process``."""
+    with patch.object(dyvine_logging, "_process", None):
+        first = dyvine_logging._current_process()
+        assert dyvine_logging._current_process() is first
+
+
+def test_context_logger_skips_disabled_levels() -> None:
+    """Disabled levels return before the wrapped logger is touched."""
+    cl = ContextLogger("test.disabled")
+    cl.logger.setLevel(logging.WARNING)
+    assert not cl.is_enabled_for(logging.INFO)
+    assert cl.is_enabled_for(logging.WARNING)
+    with patch.object(cl.logger, "log") as mock_log:
+        cl.debug("quiet")
+        cl.info("quiet")
+        assert not mock_log.called
+        cl.warning("loud")
+        assert mock_log.call_count == 1
+
+
 def test_context_logger_exception_sets_exc_info() -> None:
     """Verify context logger exception sets exc info."""
     cl = ContextLogger("test.exc")
+    cl.logger.setLevel(logging.DEBUG)
     with patch.object(cl.logger, "log") as mock_log:
         cl.exception("fail")
         _, kwargs = mock_log.call_args
@@ -215,3 +260,105 @@ def test_context_logger_shares_correlation_id_across_instances() -> None:
 
     first.add_context(tenant="acme")
     assert second.context["tenant"] == "acme"
+
+
+def test_setup_logging_writes_through_queue_listener(tmp_path, monkeypatch) -> None:
+    """Root only carries the queue handler; records land in the file on stop."""
+    monkeypatch.chdir(tmp_path)
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    try:
+        dyvine_logging.setup_logging()
+        assert [type(h) for h in root.handlers] == [
+            dyvine_logging._InProcessQueueHandler
+        ]
+        try:
+            raise ValueError("queued-err")
+        except ValueError:
+            logging.getLogger("test.queue").exception("boom %s", "arg")
+        dyvine_logging.shutdown_logging()
+        assert dyvine_logging._queue_listener is None
+
+        lines = (tmp_path / "logs" / "dyvine.log").read_text().splitlines()
+        data = json.loads(lines[-1])
+        assert data["message"] == "boom arg"
+        assert data["exception"]["type"] == "ValueError"
+    finally:
+        dyvine_logging.shutdown_logging()
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+
+
+def test_shutdown_logging_detaches_queue_handler(tmp_path, monkeypatch) -> None:
+    """Records logged after shutdown are not parked in the dead queue."""
+    monkeypatch.chdir(tmp_path)
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    try:
+        dyvine_logging.setup_logging()
+        queue_handler = dyvine_logging._queue_handler
+        assert queue_handler is not None
+
+        dyvine_logging.shutdown_logging()
+        logging.getLogger("test.after_shutdown").warning("late record")
+
+        assert queue_handler not in root.handlers
+        assert dyvine_logging._queue_handler is None
+        assert queue_handler.queue.empty()
+    finally:
+        dyvine_logging.shutdown_logging()
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+
+
+def test_setup_logging_is_noop_while_listener_runs(tmp_path, monkeypatch) -> None:
+    """A second call keeps the running listener and root handlers."""
+    monkeypatch.chdir(tmp_path)
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    try:
+        dyvine_logging.setup_logging()
+        listener = dyvine_logging._queue_listener
+        handlers = list(root.handlers)
+
+        dyvine_logging.setup_logging()
+
+        assert dyvine_logging._queue_listener is listener
+        assert root.handlers == handlers
+    finally:
+        dyvine_logging.shutdown_logging()
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+
+
+def test_json_formatter_stringifies_non_json_extra() -> None:
+    """A non-serialisable ``extra`` value is rendered, not dropped."""
+    from pathlib import PurePosixPath
+
+    fmt = JSONFormatter()
+    record = _make_record("with-extra")
+    record.extra = {"path": PurePosixPath("/tmp/x")}
+    data = json.loads(fmt.format(record))
+    assert data["extra"] == {"path": "/tmp/x"}
+
+
+def test_json_formatter_timestamp_matches_isoformat() -> None:
+    """The cached-second timestamp renders like ``datetime.isoformat``."""
+    from datetime import UTC, datetime
+
+    fmt = JSONFormatter()
+    for created in (
+        1_760_000_000.25,
+        1_760_000_000.5,
+        1_760_000_001.125,
+        # Not exactly representable: truncation would give ``.299999``.
+        1_760_000_000.3,
+        # Whole second: ``isoformat`` omits the fraction.
+        1_760_000_000.0,
+        # Rounds up into the next second.
+        1_760_000_000.9999996,
+    ):
+        record = _make_record()
+        record.created = created
+        expected = datetime.fromtimestamp(created, tz=UTC).isoformat()
+        assert json.loads(fmt.format(record))["timestamp"] == expected
@@ -188,6 +188,18 @@ def test_douyin_settings_proxies_none_by_default() -> None:
     assert s.proxies["https://"] is None
 
 
+def test_douyin_settings_headers_cached_until_source_changes() -> None:
+    """Verify headers/proxies are reused and rebuilt after reassignment."""
+    s = DouyinSettings(cookie="ck")
+    assert s.headers is s.headers
+    assert s.proxies is s.proxies
+
+    s.cookie = "rotated"
+    s.proxy_http = "http://p"
+    assert s.headers["Cookie"] == "rotated"
+    assert s.proxies["http://"] == "http://p"
+
+
 # ── Settings (composite) ────────────────────────────────────────────────
 
 
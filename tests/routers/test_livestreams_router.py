@@ -9,6 +9,7 @@ from fastapi import HTTPException
 
 from dyvine.core.exceptions import OperationNotFoundError, UserNotFoundError
 from dyvine.schemas.livestreams import (
+    LiveStreamBatchDownloadRequest,
     LiveStreamDownloadResponse,
     LiveStreamURLDownloadRequest,
 )
@@ -149,6 +150,52 @@ async def test_download_livestream_url_livestream_error(
     assert exc_info.value.status_code == 404
 
 
+# ── download_livestreams_batch ───────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_download_livestreams_batch_reports_per_item_results(
+    mock_livestream_service: MagicMock,
+) -> None:
+    """One failing item is reported in place without failing the batch."""
+    from dyvine.routers.livestreams import download_livestreams_batch
+
+    scheduled = LiveStreamDownloadResponse(
+        operation_id="op3",
+        operation_type="livestream_download",
+        subject_id="room-3",
+        status="pending",
+        message="scheduled",
+        created_at="2026-04-17T00:00:00+00:00",
+        updated_at="2026-04-17T00:00:00+00:00",
+    )
+    mock_livestream_service.download_stream.side_effect = [
+        scheduled,
+        LivestreamError("offline"),
+        RuntimeError("boom"),
+    ]
+    request = LiveStreamBatchDownloadRequest(
+        items=[
+            {"id": "ok", "url": "https://live.douyin.com/1"},
+            {"id": "offline", "url": "https://live.douyin.com/2"},
+            {"id": "broken", "url": "https://live.douyin.com/3"},
+        ]
+    )
+
+    result = await download_livestreams_batch(
+        request=request, service=mock_livestream_service
+    )
+
+    assert [(r.id, r.status_code) for r in result.results] == [
+        ("ok", 202),
+        ("offline", 404),
+        ("broken", 500),
+    ]
+    assert result.results[0].operation == scheduled
+    assert result.results[1].error == "offline"
+    assert result.results[2].error == "Internal server error"
+
+
 # ── get_download_status ──────────────────────────────────────────────────
 
 
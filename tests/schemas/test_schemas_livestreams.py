@@ -6,6 +6,8 @@ import pytest
 from pydantic import ValidationError
 
 from dyvine.schemas.livestreams import (
+    MAX_BATCH_DOWNLOAD_ITEMS,
+    LiveStreamBatchDownloadRequest,
     LiveStreamDownloadRequest,
     LiveStreamDownloadResponse,
     LiveStreamURLDownloadRequest,
@@ -98,3 +100,22 @@ def test_livestream_download_response_fields() -> None:
     )
     assert resp2.download_path is None
     assert resp2.error == "fail"
+
+
+def test_livestream_batch_request_rejects_duplicate_ids() -> None:
+    """Verify batch items must carry unique ids."""
+    item = {"id": "a", "url": "https://live.douyin.com/123"}
+    with pytest.raises(ValidationError):
+        LiveStreamBatchDownloadRequest(items=[item, item])
+
+
+def test_livestream_batch_request_enforces_item_bounds() -> None:
+    """Verify empty and oversized batches are rejected."""
+    with pytest.raises(ValidationError):
+        LiveStreamBatchDownloadRequest(items=[])
+    items = [
+        {"id": str(i), "url": "https://live.douyin.com/123"}
+        for i in range(MAX_BATCH_DOWNLOAD_ITEMS + 1)
+    ]
+    with pytest.raises(ValidationError):
+        LiveStreamBatchDownloadRequest(items=items)
@@ -96,6 +96,14 @@ def test_determine_post_type_invalid_aweme_type() -> None:
     assert svc._determine_post_type({"aweme_type": "bad"}) == PostType.UNKNOWN
 
 
+def test_determine_post_type_null_video() -> None:
+    """Verify a null ``video`` field does not escape as AttributeError."""
+    svc = _build_service()
+    assert svc._determine_post_type({"aweme_type": 0, "video": None}) == (
+        PostType.UNKNOWN
+    )
+
+
 # ── _extract_video_info ──────────────────────────────────────────────────
 
 
@@ -181,6 +189,19 @@ def test_extract_image_urls_valid() -> None:
     assert len(urls) == 3
 
 
+def test_extract_image_urls_skips_invalid_entries() -> None:
+    """Verify non-dict images and non-http URLs are dropped."""
+    svc = _build_service()
+    post = {
+        "images": [
+            "not-a-dict",
+            {"url_list": None},
+            {"url_list": ["", "ftp://example.com/x.jpg", "https://example.com/a"]},
+        ]
+    }
+    assert svc._extract_image_urls(post) == ["https://example.com/a"]
+
+
 def test_extract_image_urls_empty() -> None:
     """Verify extract image urls empty."""
     svc = _build_service()
@@ -597,6 +618,7 @@ def test_downloader_payload_helpers_ignore_invalid_shapes() -> None:
 
     assert posts_mod._video_urls_from_raw_post({"video": "bad"}) == []
     assert posts_mod._url_list_from("ftp://example.com/file.mp4") == []
+    assert posts_mod._url_list_from("httpfoo://example.com/file.mp4") == []
     assert posts_mod._url_list_from({"url_list": "https://example.com/file.mp4"}) == [
         "https://example.com/file.mp4"
     ]
@@ -719,6 +741,65 @@ async def test_run_bulk_download_marks_completed_for_zero_post_user(
     assert refreshed.error is None
 
 
+@pytest.mark.asyncio
+async def test_resolve_user_path_reuses_cached_directory() -> None:
+    """Repeat lookups inside the TTL skip the f2 user DB and profile fetch."""
+    from pathlib import Path
+    from unittest.mock import patch
+
+    handler = MagicMock()
+    handler.kwargs = {"mode": "all"}
+    handler.get_or_add_user_data = AsyncMock(return_value=Path("/tmp/cached-user"))
+    svc = _build_service(handler)
+
+    with patch("dyvine.services.posts.AsyncUserDB") as mock_db:
+        mock_ctx = MagicMock()
+        mock_ctx.__aenter__ = AsyncMock(return_value=MagicMock())
+        mock_ctx.__aexit__ = AsyncMock(return_value=False)
+        mock_db.return_value = mock_ctx
+
+        first = await svc._resolve_user_path("u1")
+        second = await svc._resolve_user_path("u1")
+        assert first == second == Path("/tmp/cached-user")
+        assert handler.get_or_add_user_data.await_count == 1
+
+        # Age the entry past the TTL so the next lookup re-resolves.
+        cache = svc._user_path_cache
+        assert cache is not None
+        resolved_at, path = cache["u1"]
+        cache["u1"] = (resolved_at - posts_mod.USER_PATH_CACHE_TTL_SECONDS, path)
+        await svc._resolve_user_path("u1")
+        assert handler.get_or_add_user_data.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_user_db_is_opened_once_and_closed_on_close() -> None:
+    """Cache misses share one f2 user DB connection until ``close``."""
+    from pathlib import Path
+    from unittest.mock import patch
+
+    handler = MagicMock()
+    handler.kwargs = {"mode": "all"}
+    handler.get_or_add_user_data = AsyncMock(return_value=Path("/tmp/user"))
+    svc = _build_service(handler)
+
+    with patch("dyvine.services.posts.AsyncUserDB") as mock_db:
+        mock_ctx = MagicMock()
+        db = MagicMock()
+        mock_ctx.__aenter__ = AsyncMock(return_value=db)
+        mock_ctx.__aexit__ = AsyncMock(return_value=False)
+        mock_db.return_value = mock_ctx
+
+        await svc._resolve_user_path("u1")
+        await svc._resolve_user_path("u2")
+        assert mock_db.call_count == 1
+        assert handler.get_or_add_user_data.await_args.args[2] is db
+
+        await svc.close()
+        await svc.close()
+        mock_ctx.__aexit__.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_run_bulk_download_records_failure_when_user_disappears(
     tmp_path,
@@ -138,6 +138,43 @@ async def test_get_user_info_success(monkeypatch: pytest.MonkeyPatch) -> None:
     assert result.is_living is False
 
 
+@pytest.mark.asyncio
+async def test_close_releases_shared_profile_handler(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """``close`` shuts the shared handler's downloader once, then is a no-op."""
+    from dyvine.services import users as users_mod
+
+    mock_user_data = MagicMock()
+    mock_user_data.nickname = "TestUser"
+    mock_user_data.avatar_url = None
+    mock_user_data.room_id = None
+    mock_user_data._to_raw.return_value = {"user": {}}
+    downloader = MagicMock()
+    downloader.close = AsyncMock()
+
+    class FakeHandler:
+        """Test double used by test_close_releases_shared_profile_handler."""
+
+        def __init__(self, kwargs: dict) -> None:
+            """Test helper for FakeHandler."""
+            self.downloader = downloader
+
+        fetch_user_profile = AsyncMock(return_value=mock_user_data)
+
+    monkeypatch.setattr(users_mod, "DouyinHandler", FakeHandler)
+
+    service = UserService()
+    await service.get_user_info("test-user")
+    await service.get_user_info("test-user")
+    downloader.close.assert_not_awaited()
+
+    await service.close()
+    await service.close()
+
+    downloader.close.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_get_user_info_not_found(monkeypatch: pytest.MonkeyPatch) -> None:
     """Verify get user info not found."""
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import AsyncMock
+
 import pytest
 from fastapi import HTTPException
 
@@ -19,9 +21,9 @@ class DummyHandler:
 @pytest.fixture(autouse=True)
 def reset_container_cache() -> None:
     """Test helper for this module."""
-    dependencies.get_service_container.cache_clear()
+    dependencies.reset_service_container()
     yield
-    dependencies.get_service_container.cache_clear()
+    dependencies.reset_service_container()
 
 
 @pytest.mark.asyncio
@@ -51,6 +53,25 @@ async def test_service_container_initializes_with_douyin_handler(
     assert captured_kwargs.get("max_tasks") == 3
 
 
+@pytest.mark.asyncio
+async def test_service_container_shutdown_closes_handler_downloader(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+) -> None:
+    """Shutdown closes the shared downloader's pooled HTTP client once."""
+    monkeypatch.setattr(dependencies.settings.douyin, "download_root", str(tmp_path))
+    handler = DummyHandler({})
+    handler.downloader = AsyncMock()  # type: ignore[attr-defined]
+    monkeypatch.setattr(dependencies, "DouyinHandler", lambda kwargs: handler)
+
+    container = dependencies.ServiceContainer()
+    await container.initialize()
+    await container.shutdown()
+    await container.shutdown()
+
+    handler.downloader.close.assert_awaited_once()  # type: ignore[attr-defined]
+
+
 def test_get_service_container_returns_singleton(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -65,17 +86,40 @@ def test_get_service_container_returns_singleton(
     assert container_one is container_two
 
 
-def test_require_api_key_allows_missing_header_when_gate_disabled(
+@pytest.mark.asyncio
+async def test_get_service_only_resolves_registered_services(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+) -> None:
+    """Executors and internal flags are not reachable by name."""
+    monkeypatch.setattr(dependencies.settings.douyin, "download_root", str(tmp_path))
+    monkeypatch.setattr(
+        dependencies, "DouyinHandler", lambda kwargs: DummyHandler(kwargs)
+    )
+
+    container = dependencies.ServiceContainer()
+    await container.initialize()
+    try:
+        assert container.get_service("post_service") is container.post_service
+        for name in ("r2_executor", "background_tasks", "initialized", "missing"):
+            assert container.get_service(name) is None
+    finally:
+        await container.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_require_api_key_allows_missing_header_when_gate_disabled(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Verify the dependency is a no-op behind another auth layer."""
     monkeypatch.setattr(dependencies.settings.security, "require_api_key", False)
     monkeypatch.setattr(dependencies.settings.security, "api_key", "expected")
 
-    assert dependencies.require_api_key(None) is None
+    assert await dependencies.require_api_key(None) is None
 
 
-def test_require_api_key_rejects_missing_header(
+@pytest.mark.asyncio
+async def test_require_api_key_rejects_missing_header(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Verify missing API keys are rejected when the gate is enabled."""
@@ -83,14 +127,15 @@ def test_require_api_key_rejects_missing_header(
     monkeypatch.setattr(dependencies.settings.security, "api_key", "expected")
 
     with pytest.raises(HTTPException) as exc_info:
-        dependencies.require_api_key(None)
+        await dependencies.require_api_key(None)
 
     assert exc_info.value.status_code == 401
     assert exc_info.value.detail == "Invalid or missing API key"
     assert exc_info.value.headers == {"WWW-Authenticate": "ApiKey"}
 
 
-def test_require_api_key_rejects_wrong_header(
+@pytest.mark.asyncio
+async def test_require_api_key_rejects_wrong_header(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Verify non-matching API keys are rejected."""
@@ -98,19 +143,34 @@ def test_require_api_key_rejects_wrong_header(
     monkeypatch.setattr(dependencies.settings.security, "api_key", "expected")
 
     with pytest.raises(HTTPException) as exc_info:
-        dependencies.require_api_key("wrong")
+        await dependencies.require_api_key("wrong")
 
     assert exc_info.value.status_code == 401
 
 
-def test_require_api_key_accepts_matching_header(
+@pytest.mark.asyncio
+async def test_require_api_key_rejects_non_ascii_header(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify non-ASCII API keys are rejected instead of raising."""
+    monkeypatch.setattr(dependencies.settings.security, "require_api_key", True)
+    monkeypatch.setattr(dependencies.settings.security, "api_key", "expected")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await dependencies.require_api_key("expécted")
+
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_require_api_key_accepts_matching_header(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Verify matching API keys pass the dependency."""
     monkeypatch.setattr(dependencies.settings.security, "require_api_key", True)
     monkeypatch.setattr(dependencies.settings.security, "api_key", "expected")
 
-    assert dependencies.require_api_key("expected") is None
+    assert await dependencies.require_api_key("expected") is None
 
 
 @pytest.mark.asyncio
@@ -195,3 +255,21 @@ async def test_service_container_exposes_post_service(
     fetched = await container.operation_store.get_operation(operation.operation_id)
     assert fetched.operation_id == operation.operation_id
     assert dependencies.get_post_service.__name__ == "get_post_service"
+
+
+@pytest.mark.asyncio
+async def test_dependency_providers_resolve_from_shared_container(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Async providers hand out the lifespan-initialized container services."""
+    monkeypatch.setattr(
+        dependencies, "DouyinHandler", lambda kwargs: DummyHandler(kwargs)
+    )
+    container = dependencies.get_service_container()
+    await container.initialize()
+
+    assert await dependencies.get_douyin_handler() is container.douyin_handler
+    assert await dependencies.get_user_service() is container.user_service
+    assert await dependencies.get_post_service() is container.post_service
+    assert await dependencies.get_livestream_service() is container.livestream_service
+    await container.shutdown()
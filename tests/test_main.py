@@ -2,11 +2,13 @@
 
 import sqlite3
 import uuid
+import warnings
 from collections.abc import Iterator
 
 import pytest
 from fastapi.testclient import TestClient
 
+from dyvine import main as main_module
 from dyvine.core.settings import settings
 from dyvine.main import app
 
@@ -76,6 +78,25 @@ def test_read_main():
         assert data["features"] == ["users", "posts", "livestreams"]
 
 
+def test_openapi_schema_generates_without_warnings() -> None:
+    """Every operation gets a unique ID; duplicates would warn at startup."""
+    app.openapi_schema = None
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        schema = app.openapi()
+
+    health = schema["paths"]["/health"]
+    assert set(health) == {"get"}
+    assert health["get"]["operationId"] == "health_check_health_get"
+
+
+def test_openapi_schema_built_during_startup() -> None:
+    """The schema is cached by lifespan, not on the first docs request."""
+    app.openapi_schema = None
+    with TestClient(app):
+        assert app.openapi_schema is not None
+
+
 def test_readiness_probe_returns_ready_when_all_dependencies_ok(
     prime_ready_dependencies: TestClient,
 ) -> None:
@@ -272,6 +293,28 @@ def test_invalid_request_id_is_regenerated(monkeypatch: pytest.MonkeyPatch) -> N
         uuid.UUID(response.headers["X-Correlation-ID"])
 
 
+def test_non_canonical_request_id_is_normalised() -> None:
+    """Upper-case or undashed UUIDs are accepted in canonical form."""
+    request_id = uuid.uuid4()
+    with TestClient(app) as client:
+        response = client.get(
+            "/livez", headers={"X-Request-ID": request_id.hex.upper()}
+        )
+
+        assert response.headers["X-Correlation-ID"] == str(request_id)
+
+
+def test_repeated_request_id_uses_first_occurrence() -> None:
+    """A repeated ``X-Request-ID`` header resolves to its first value."""
+    first, second = str(uuid.uuid4()), str(uuid.uuid4())
+    with TestClient(app) as client:
+        response = client.get(
+            "/livez", headers=[("X-Request-ID", first), ("X-Request-ID", second)]
+        )
+
+        assert response.headers["X-Correlation-ID"] == first
+
+
 def test_health_check_returns_200_when_r2_missing(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -306,6 +349,40 @@ def test_health_check_returns_200_when_r2_missing(
         uuid.UUID(correlation_id)
 
 
+def test_health_check_reuses_lifespan_process_handle(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """``/health`` samples the ``psutil.Process`` primed at startup."""
+    with TestClient(app) as client:
+        assert app.state.process is not None
+
+        def _unexpected_process() -> None:
+            raise AssertionError("psutil.Process() called per request")
+
+        monkeypatch.setattr(main_module.psutil, "Process", _unexpected_process)
+
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.json()["cpu_percent"] >= 0
+
+
+def test_health_check_head_skips_body(monkeypatch: pytest.MonkeyPatch) -> None:
+    """``HEAD /health`` answers 200 without sampling the process."""
+    with TestClient(app) as client:
+
+        def _unexpected_sample() -> None:
+            raise AssertionError("HEAD /health sampled psutil")
+
+        monkeypatch.setattr(app.state.process, "memory_info", _unexpected_sample)
+
+        response = client.head("/health")
+
+        assert response.status_code == 200
+        assert response.content == b""
+        assert "X-Correlation-ID" in response.headers
+
+
 def test_health_check_reports_r2_disabled_in_local_retention_mode(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -370,3 +447,26 @@ def test_metrics_uses_bounded_label_for_unmatched_routes() -> None:
         assert response.status_code == 200
         assert 'route="unmatched"' in response.text
         assert "/definitely-not-a-real-route" not in response.text
+
+
+def test_correlation_header_set_on_unmatched_route() -> None:
+    """The ASGI middleware tags router-generated 404s with the request ID."""
+    request_id = str(uuid.uuid4())
+    with TestClient(app) as client:
+        response = client.get(
+            "/definitely-not-a-real-route", headers={"X-Request-ID": request_id}
+        )
+
+        assert response.status_code == 404
+        assert response.headers["X-Correlation-ID"] == request_id
+
+
+def test_large_responses_are_gzip_encoded() -> None:
+    """Bodies above the GZip threshold are compressed on request."""
+    assert app.openapi_url is not None
+    with TestClient(app) as client:
+        response = client.get(app.openapi_url, headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["X-Correlation-ID"]